@@ -1,5 +1,7 @@
 """CAD library functions for the project."""
 
+import functools
+import math
 from collections.abc import Generator
 
 import build123d as bd
@@ -7,12 +9,13 @@ import build123d as bd
 
 def float_range(start: float, stop: float, step: float) -> Generator[float, None, None]:
     """Generate float values, starting with `start` up to `stop`."""
-    while start < stop:
+    # Compute each value from its index, so error doesn't accumulate across steps.
+    for i in range(math.ceil((stop - start) / step)):
         # Round to avoid floating-point precision issues
-        yield round(start, 10)
-        start += step
+        yield round(start + i * step, 10)
 
 
+@functools.lru_cache(maxsize=16)
 def make_curved_bent_cylinder(
     *,
     diameter: float,
@@ -26,6 +29,7 @@ def make_curved_bent_cylinder(
     * Top snorkel part starts at the origin, then goes down, then in the +Y direction.
     * Makes a 90-degree bend. All X=0.
     * Changing the bend_radius will not change the placement of the straight segments.
+    * Cached: the same Part is returned for the same args. Don't modify it in place.
 
     Args:
     ----
@@ -42,31 +46,50 @@ def make_curved_bent_cylinder(
         msg = "Horizontal angle rotation not implemented."
         raise NotImplementedError(msg)
 
-    line_vertical = bd.Line((0, 0, 0), (0, 0, -vertical_seg_length + bend_radius))
-    line_horizontal = bd.Line(
-        (0, bend_radius, -vertical_seg_length),
-        (0, horizontal_seg_length, -vertical_seg_length),
-    )
-    line_sum = line_vertical + (
-        # bd.Plane.YZ *
-        bd.CenterArc(
-            (0, 0, 0),
-            radius=bend_radius,
-            start_angle=270,
-            arc_size=90 - horizontal_angle,
+    radius = diameter / 2
+
+    # Built from primitives (cylinder + quarter torus + cylinder), which is much
+    # cheaper than sweeping a circle along the Line+CenterArc+Line path.
+    segments: list[bd.Part] = []
+
+    # Vertical segment, from the origin down to the start of the bend.
+    if vertical_seg_length > bend_radius:
+        segments.append(
+            bd.Cylinder(
+                radius=radius,
+                height=vertical_seg_length - bend_radius,
+                align=(bd.Align.CENTER, bd.Align.CENTER, bd.Align.MAX),
+            ),
         )
-        .rotate(bd.Axis.Y, 90)  # Rotate to be in the YZ plane.
-        .translate((0, bend_radius, -vertical_seg_length + bend_radius))
+
+    # Bend. The quarter torus goes from +X to +Y in its own plane, which is
+    # mapped to go from -Y (above the center) to -Z (towards +Y) in the YZ plane.
+    segments.append(
+        bd.Plane(
+            origin=(0, bend_radius, -vertical_seg_length + bend_radius),
+            x_dir=(0, -1, 0),
+            z_dir=(1, 0, 0),
+        )
+        * bd.Torus(
+            major_radius=bend_radius,
+            minor_radius=radius,
+            major_angle=90,
+            align=None,
+        ),
     )
-    if horizontal_seg_length > 0:
-        line_sum += line_horizontal
 
-    sweep_polygon = bd.Plane.XY * bd.Circle(diameter / 2)
-    assert isinstance(sweep_polygon, bd.SweepType)  # Type checking.
-    line_sum = bd.sweep(sweep_polygon, path=line_sum)
-    assert isinstance(line_sum, bd.Part)  # Type checking.
+    # Horizontal segment, from the end of the bend out to Y=horizontal_seg_length.
+    if horizontal_seg_length > bend_radius:
+        segments.append(
+            bd.Plane(origin=(0, bend_radius, -vertical_seg_length), z_dir=(0, 1, 0))
+            * bd.Cylinder(
+                radius=radius,
+                height=horizontal_seg_length - bend_radius,
+                align=(bd.Align.CENTER, bd.Align.CENTER, bd.Align.MIN),
+            ),
+        )
 
-    return line_sum
+    return bd.Part(None) + segments
 
 
 def make_angled_cylinders(
@@ -107,23 +130,3 @@ def make_angled_cylinders(
     )
 
     return part
-
-
-def demo_test_make_curved_bent_cylinder() -> bd.Part:
-    """Make a curved bent cylinder using the applicable function."""
-    return make_curved_bent_cylinder(
-        diameter=0.5,
-        vertical_seg_length=4,
-        horizontal_seg_length=5,
-        bend_radius=1,
-    )
-
-
-def demo_test_make_angled_cylinders() -> bd.Part:
-    """Make angled cylinders using the applicable function."""
-    return make_angled_cylinders(
-        diameter=0.5,
-        vertical_seg_length=4,
-        horizontal_seg_length=5,
-        horizontal_angle=-30,
-    )
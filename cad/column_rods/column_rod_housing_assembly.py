@@ -11,7 +11,7 @@
 import copy
 import json
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from itertools import product
 from pathlib import Path
@@ -61,7 +61,7 @@ class GenericRodProperties:
 
     def deep_copy(self) -> "GenericRodProperties":
         """Copy the current properties."""
-        return copy.deepcopy(self)
+        return replace(self)
 
     def __str__(self) -> str:
         """Return string representation of the properties, as JSON."""
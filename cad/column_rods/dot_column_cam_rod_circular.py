@@ -5,10 +5,8 @@ Would require that the bed be lifted.
 This design creates a circular cam rod, and each dot is a cone.
 """
 
-import copy
-import json
-import random
-from dataclasses import dataclass
+import functools
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from itertools import product
 from pathlib import Path
@@ -20,7 +18,7 @@ from build123d_ease import show
 from loguru import logger
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True)
 class MainSpec:
     """Specification for braille cell housing."""
 
@@ -43,18 +41,17 @@ class MainSpec:
     cam_rod_diameter: float = 2.4  # Must be less than dot_pitch_x.
     cam_rod_length: float = 10
 
-    def __post_init__(self) -> None:
-        """Post initialization checks."""
-        data = {}
-        logger.info(json.dumps(data, indent=2))
-
     def deep_copy(self) -> "MainSpec":
         """Copy the current spec."""
-        return copy.deepcopy(self)
+        return replace(self)
 
 
+@functools.lru_cache(maxsize=16)
 def make_cam_rod(spec: MainSpec) -> bd.Part:
-    """Make a single cam rod, pointing in Z axis."""
+    """Make a single cam rod, pointing in Z axis.
+
+    Cached: the same Part is returned for an equal spec. Don't modify it in place.
+    """
     p = bd.Part(None)
 
     p += bd.Cylinder(
@@ -67,7 +64,33 @@ def make_cam_rod(spec: MainSpec) -> bd.Part:
         angle=360 / 16,
     )
 
-    # Remove the magnets (one on each side).
+    # Depth of the divot for each dot state. A depth of 0 means no divot.
+    divot_depths = {True: spec.dot_travel, False: spec.dot_up_divot_depth}
+
+    # There are only two divot shapes (pin extended or not), so build each once.
+    divot_parts = {
+        is_pin_extended: (
+            bd.Cone(
+                # Bottom is toward the center of the cam rod.
+                bottom_radius=spec.dot_diameter_in_rod_inner / 2,
+                top_radius=spec.dot_diameter_in_rod_outer / 2,
+                height=dot_depth,
+                align=(bd.Align.CENTER, bd.Align.CENTER, bd.Align.MIN),
+            )
+            # Add on a cylinder that removes the extra bit above the cone.
+            # Required because the faces of the cone are flat, but the rod is round.
+            + bd.Cylinder(
+                radius=spec.dot_diameter_in_rod_outer / 2,
+                height=5,
+                align=(bd.Align.CENTER, bd.Align.CENTER, bd.Align.MIN),
+            ).translate((0, 0, spec.dot_travel - 0.05))
+        )
+        for is_pin_extended, dot_depth in divot_depths.items()
+        if dot_depth > 0
+    }
+
+    # Collect the divots, then remove them all in one cut.
+    divots: list[bd.Part] = []
     for (rot_idx, rot_val), (z_idx, z_pos) in product(
         enumerate(range(0, 360, 45)),
         enumerate(bde.evenly_space_with_center(count=3, spacing=spec.dot_pitch_y)),
@@ -77,58 +100,44 @@ def make_cam_rod(spec: MainSpec) -> bd.Part:
         assert 0 <= z_idx < 3  # noqa: PLR2004
         is_pin_extended: bool = (rot_idx & (1 << z_idx)) > 0
         # logger.debug(f"{rot_idx=}, {z_idx=}, {is_pin_extended=}")
-        dot_depth = spec.dot_travel if is_pin_extended else spec.dot_up_divot_depth
-
-        p -= (
-            (
-                bd.Cone(
-                    # Bottom is toward the center of the cam rod.
-                    bottom_radius=spec.dot_diameter_in_rod_inner / 2,
-                    top_radius=spec.dot_diameter_in_rod_outer / 2,
-                    height=dot_depth,
-                    align=(bd.Align.CENTER, bd.Align.CENTER, bd.Align.MIN),
-                )
-                # Add on a cylinder that removes the extra bit above the cone.
-                # Required because the faces of the cone are flat, but the rod is round.
-                + bd.Cylinder(
-                    radius=spec.dot_diameter_in_rod_outer / 2,
-                    height=5,
-                    align=(bd.Align.CENTER, bd.Align.CENTER, bd.Align.MIN),
-                ).translate((0, 0, spec.dot_travel - 0.05))
-            )
-            .rotate(axis=bd.Axis.Y, angle=90)  # Point in Pos X.
-            .translate(
-                (
-                    spec.cam_rod_diameter / 2 - dot_depth,
-                    0,
-                    z_pos,
-                )
-            )
-            .rotate(axis=bd.Axis.Z, angle=rot_val)
+        dot_depth = divot_depths[is_pin_extended]
+        if dot_depth <= 0:
+            continue
+
+        divots.append(
+            bd.Rot(Z=rot_val)
+            * bd.Pos(spec.cam_rod_diameter / 2 - dot_depth, 0, z_pos)
+            * bd.Rot(Y=90)  # Point in Pos X.
+            * divot_parts[is_pin_extended]
         )
 
+    p -= divots
+
     return p
 
 
 def make_assembly_cam_rod(spec: MainSpec) -> bd.Part:
     """Make an assembly of cam rod with magnet."""
-    p = bd.Part(None)
+    rods: list[bd.Part] = []
+
+    # Every rod is identical, so build it once and place copies.
+    cam_rod = make_cam_rod(spec)
 
-    for cell_x, dot_offset_x in product(
-        bde.evenly_space_with_center(count=3, spacing=spec.inter_cell_pitch_x),
-        bde.evenly_space_with_center(count=2, spacing=spec.cam_pitch_x),
+    for rod_num, (cell_x, dot_offset_x) in enumerate(
+        product(
+            bde.evenly_space_with_center(count=3, spacing=spec.inter_cell_pitch_x),
+            bde.evenly_space_with_center(count=2, spacing=spec.cam_pitch_x),
+        )
     ):
         dot_x = cell_x + dot_offset_x
 
-        random_rot_value = random.randint(0, 359)
+        # Show each rod at a different cam position (deterministic output).
+        rot_value = rod_num * 45
 
-        p += (
-            make_cam_rod(spec)
-            .rotate(axis=bd.Axis.Z, angle=random_rot_value)
-            .translate((0, dot_x, 0))
-        )
+        rods.append(bd.Pos(Y=dot_x) * bd.Rot(Z=rot_value) * cam_rod)
 
-    return p
+    # The rods don't touch, so group them into one Part without a boolean fuse.
+    return bd.Part(rods)
 
 
 if __name__ == "__main__":
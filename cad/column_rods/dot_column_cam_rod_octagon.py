@@ -5,11 +5,10 @@ Would require that the bed be lifted.
 This design creates an octagonal prism cam rod, and each dot is a slice of that prism.
 """
 
-import copy
+import functools
 import json
 import math
-import random
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from itertools import product
 from pathlib import Path
@@ -21,7 +20,7 @@ from build123d_ease import show
 from loguru import logger
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True)
 class MainSpec:
     """Specification for braille cell housing."""
 
@@ -61,7 +60,7 @@ class MainSpec:
 
     def deep_copy(self) -> "MainSpec":
         """Copy the current spec."""
-        return copy.deepcopy(self)
+        return replace(self)
 
     @property
     def polygon_minor_diameter(self) -> float:
@@ -78,8 +77,12 @@ class MainSpec:
         )
 
 
+@functools.lru_cache(maxsize=16)
 def make_cam_rod(spec: MainSpec) -> bd.Part:
-    """Make a single cam rod, pointing in Z axis."""
+    """Make a single cam rod, pointing in Z axis.
+
+    Cached: the same Part is returned for an equal spec. Don't modify it in place.
+    """
     p = bd.Part(None)
 
     p += (
@@ -95,16 +98,9 @@ def make_cam_rod(spec: MainSpec) -> bd.Part:
         .rotate(axis=bd.Axis.Z, angle=360 / spec.cam_rod_polygon_side_count / 2)
     )
 
-    # Remove the magnets (one on each side).
-    for (rot_idx, rot_val), (z_idx, z_pos) in product(
-        enumerate(range(0, 360, 360 // spec.cam_rod_polygon_side_count)),
-        enumerate(bde.evenly_space_with_center(count=3, spacing=spec.dot_pitch_y)),
-    ):
-        # Only dig out not-extended pins.
-        assert 0 <= rot_idx < spec.cam_rod_polygon_side_count
-        assert 0 <= z_idx < 3  # noqa: PLR2004
-        is_pin_up: bool = (rot_idx & (1 << z_idx)) > 0
-
+    # There are only two divot shapes (pin up or down), so build each once.
+    divot_parts: dict[bool, bd.Part] = {}
+    for is_pin_up in (True, False):
         if is_pin_up:
             dot_width_top = spec.divot_dot_up_width_top
             dot_width_bottom = spec.divot_dot_up_width_bottom
@@ -119,47 +115,59 @@ def make_cam_rod(spec: MainSpec) -> bd.Part:
         if dot_width_bottom is None:
             dot_width_bottom = spec.polygon_side_length
 
-        p -= (
-            (
-                bd.extrude(
-                    # Draw out a polygon for the divot facing +X.
-                    bd.make_face(
-                        bd.Plane.XY
-                        * bd.Polyline(  # type: ignore reportArgumentType
-                            # 2 points at the "top" (far right, toward edge).
-                            (
-                                spec.polygon_minor_diameter / 2,
-                                +dot_width_top / 2,
-                            ),
-                            (
-                                spec.polygon_minor_diameter / 2,
-                                -dot_width_top / 2,
-                            ),
-                            # 2 points at the "bottom" (toward center).
-                            (
-                                spec.polygon_minor_diameter / 2 - dot_depth,
-                                -dot_width_bottom / 2,
-                            ),
-                            (
-                                spec.polygon_minor_diameter / 2 - dot_depth,
-                                +dot_width_bottom / 2,
-                            ),
-                            close=True,
-                        )
+        if dot_depth <= 0:
+            continue  # No divot for this state.
+
+        divot_parts[is_pin_up] = bd.extrude(
+            # Draw out a polygon for the divot facing +X.
+            bd.make_face(
+                bd.Plane.XY
+                * bd.Polyline(  # type: ignore reportArgumentType
+                    # 2 points at the "top" (far right, toward edge).
+                    (
+                        spec.polygon_minor_diameter / 2,
+                        +dot_width_top / 2,
                     ),
-                    amount=spec.divot_length_axial,
-                )
-            )
-            .translate(
-                (
-                    0,
-                    0,
-                    z_pos - spec.divot_length_axial / 2,
+                    (
+                        spec.polygon_minor_diameter / 2,
+                        -dot_width_top / 2,
+                    ),
+                    # 2 points at the "bottom" (toward center).
+                    (
+                        spec.polygon_minor_diameter / 2 - dot_depth,
+                        -dot_width_bottom / 2,
+                    ),
+                    (
+                        spec.polygon_minor_diameter / 2 - dot_depth,
+                        +dot_width_bottom / 2,
+                    ),
+                    close=True,
                 )
-            )
-            .rotate(axis=bd.Axis.Z, angle=rot_val)
+            ),
+            amount=spec.divot_length_axial,
         )
 
+    # Collect the divots, then remove them all in one cut.
+    divots: list[bd.Part] = []
+    for (rot_idx, rot_val), (z_idx, z_pos) in product(
+        enumerate(range(0, 360, 360 // spec.cam_rod_polygon_side_count)),
+        enumerate(bde.evenly_space_with_center(count=3, spacing=spec.dot_pitch_y)),
+    ):
+        # Only dig out not-extended pins.
+        assert 0 <= rot_idx < spec.cam_rod_polygon_side_count
+        assert 0 <= z_idx < 3  # noqa: PLR2004
+        is_pin_up = (rot_idx & (1 << z_idx)) > 0
+        if is_pin_up not in divot_parts:
+            continue
+
+        divots.append(
+            bd.Rot(Z=rot_val)
+            * bd.Pos(Z=z_pos - spec.divot_length_axial / 2)
+            * divot_parts[is_pin_up]
+        )
+
+    p -= divots
+
     # Trial: Remove a screw in the middle.
     # p -= bd.Cylinder(
     #     radius=1.4 / 2,
@@ -171,7 +179,10 @@ def make_cam_rod(spec: MainSpec) -> bd.Part:
 
 def make_assembly_cam_rod(spec: MainSpec) -> bd.Part:
     """Make an assembly of cam rod with magnet."""
-    p = bd.Part(None)
+    rods: list[bd.Part] = []
+
+    # Every rod is identical, so build it once and place copies.
+    cam_rod = make_cam_rod(spec)
 
     for cell_num, (cell_x, dot_offset_x) in enumerate(
         product(
@@ -181,16 +192,17 @@ def make_assembly_cam_rod(spec: MainSpec) -> bd.Part:
     ):
         dot_x = cell_x + dot_offset_x
 
-        # Randomly rotate the cam rods, except for 0 and 1.
-        random_rot_value = random.randint(0, 359) if cell_num not in (0, 1) else 0
-
-        p += (
-            make_cam_rod(spec)
-            .rotate(axis=bd.Axis.Z, angle=random_rot_value)
-            .translate((0, dot_x, 0))
+        # Show each rod at a different cam position, except for 0 and 1.
+        rot_value = (
+            cell_num * 360 / spec.cam_rod_polygon_side_count
+            if cell_num not in (0, 1)
+            else 0
         )
 
-    return p
+        rods.append(bd.Pos(Y=dot_x) * bd.Rot(Z=rot_value) * cam_rod)
+
+    # The rods don't touch, so group them into one Part without a boolean fuse.
+    return bd.Part(rods)
 
 
 if __name__ == "__main__":
@@ -9,10 +9,8 @@ Known magnet sizes:
     * D=2 x H=1 Magnet - Available.
 """
 
-import copy
-import json
-import random
-from dataclasses import dataclass
+import functools
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from itertools import product
 from pathlib import Path
@@ -24,14 +22,14 @@ from build123d_ease import show
 from loguru import logger
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True)
 class BoxMagnet:
     """Magnet specification."""
 
     magnet_dimensions: tuple[float, float, float] = (1, 2, 6)
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True)
 class CylinderMagnet:
     """Magnet specification."""
 
@@ -39,7 +37,7 @@ class CylinderMagnet:
     magnet_height: float = 1
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True)
 class MainSpec:
     """Specification for braille cell housing."""
 
@@ -58,18 +56,20 @@ class MainSpec:
     cam_rod_diameter: float = 2.4  # Must be less than dot_pitch_x.
     cam_rod_length: float = 10
 
-    def __post_init__(self) -> None:
-        """Post initialization checks."""
-        data = {}
-        logger.info(json.dumps(data, indent=2))
-
     def deep_copy(self) -> "MainSpec":
-        """Copy the current spec."""
-        return copy.deepcopy(self)
+        """Copy the current spec.
+
+        The magnet spec is frozen, so sharing it with the copy is safe.
+        """
+        return replace(self)
 
 
+@functools.lru_cache(maxsize=16)
 def make_cam_rod(spec: MainSpec) -> bd.Part:
-    """Make a single cam rod, pointing in Z axis."""
+    """Make a single cam rod, pointing in Z axis.
+
+    Cached: the same Part is returned for an equal spec. Don't modify it in place.
+    """
     p = bd.Part(None)
 
     p += bd.Cylinder(
@@ -96,86 +96,77 @@ def make_cam_rod(spec: MainSpec) -> bd.Part:
         real_magnet_thickness_x = spec.magnet.magnet_height
         z_count = 3
 
-    # Remove the magnets (one on each side).
-    for rot, z_pos in product(
-        (0, 180),
-        bde.evenly_space_with_center(count=z_count, spacing=spec.dot_pitch_y),
-    ):
-        p -= magnet_part.translate(
-            (
-                (
-                    spec.cam_rod_diameter / 2
-                    - real_magnet_thickness_x
-                    - spec.magnet_recess_below_surface
-                ),
-                0,
-                z_pos,
-            )
-        ).rotate(axis=bd.Axis.Z, angle=rot)
+    # Remove the magnets (one on each side), all in one cut.
+    magnet_x = (
+        spec.cam_rod_diameter / 2
+        - real_magnet_thickness_x
+        - spec.magnet_recess_below_surface
+    )
+    p -= [
+        bd.Rot(Z=rot) * bd.Pos(magnet_x, 0, z_pos) * magnet_part
+        for rot, z_pos in product(
+            (0, 180),
+            bde.evenly_space_with_center(count=z_count, spacing=spec.dot_pitch_y),
+        )
+    ]
 
     return p
 
 
 def make_assembly_cam_rod_with_magnet(spec: MainSpec) -> bd.Part:
     """Make an assembly of cam rod with magnet."""
-    p = bd.Part(None)
+    rods: list[bd.Part] = []
 
-    for cell_x, dot_offset_x in product(
-        bde.evenly_space_with_center(count=3, spacing=spec.inter_cell_pitch_x),
-        bde.evenly_space_with_center(count=2, spacing=spec.cam_pitch_x),
-    ):
-        dot_x = cell_x + dot_offset_x
-
-        random_rot_value = random.randint(0, 359)
-
-        p += (
-            make_cam_rod(spec)
-            .rotate(axis=bd.Axis.Z, angle=random_rot_value)
-            .translate((0, dot_x, 0))
+    if isinstance(spec.magnet, BoxMagnet):
+        magnet_part = bd.Box(
+            spec.magnet.magnet_dimensions[0],
+            spec.magnet.magnet_dimensions[1],
+            spec.magnet.magnet_dimensions[2],
+            align=(bd.Align.MIN, bd.Align.CENTER, bd.Align.CENTER),
         )
+        real_magnet_thickness_x = spec.magnet.magnet_dimensions[0]
+        z_count = 1
+    elif isinstance(spec.magnet, CylinderMagnet):
+        # Magnet points in the positive X.
+        magnet_part = bd.Cylinder(
+            radius=spec.magnet.magnet_diameter / 2,
+            height=spec.magnet.magnet_height,
+            align=(bd.Align.CENTER, bd.Align.CENTER, bd.Align.MIN),
+        ).rotate(axis=bd.Axis.Y, angle=90)
+        real_magnet_thickness_x = spec.magnet.magnet_height
+        z_count = 3
 
-        if isinstance(spec.magnet, BoxMagnet):
-            magnet_part = bd.Box(
-                spec.magnet.magnet_dimensions[0],
-                spec.magnet.magnet_dimensions[1],
-                spec.magnet.magnet_dimensions[2],
-                align=(bd.Align.MIN, bd.Align.CENTER, bd.Align.CENTER),
-            )
-            real_magnet_thickness_x = spec.magnet.magnet_dimensions[0]
-            z_count = 1
-        elif isinstance(spec.magnet, CylinderMagnet):
-            # Magnet points in the positive X.
-            magnet_part = bd.Cylinder(
-                radius=spec.magnet.magnet_diameter / 2,
-                height=spec.magnet.magnet_height,
-                align=(bd.Align.CENTER, bd.Align.CENTER, bd.Align.MIN),
-            ).rotate(axis=bd.Axis.Y, angle=90)
-            real_magnet_thickness_x = spec.magnet.magnet_height
-            z_count = 3
-
-        # Remove the magnets (one on each side).
+    magnet_x = (
+        spec.cam_rod_diameter / 2
+        - real_magnet_thickness_x
+        - spec.magnet_recess_below_surface
+    )
+
+    # Every column is identical, so build the rod with its magnets (one on each
+    # side) once, then place copies of it.
+    rod_with_magnets = make_cam_rod(spec) + [
+        bd.Rot(Z=rot) * bd.Pos(magnet_x, 0, z_pos) * magnet_part
         for rot, z_pos in product(
             (0, 180),
             bde.evenly_space_with_center(count=z_count, spacing=spec.dot_pitch_y),
-        ):
-            p += (
-                magnet_part.translate(
-                    (
-                        (
-                            spec.cam_rod_diameter / 2
-                            - real_magnet_thickness_x
-                            - spec.magnet_recess_below_surface
-                        ),
-                        0,
-                        z_pos,
-                    )
-                )
-                .rotate(axis=bd.Axis.Z, angle=rot)
-                .rotate(axis=bd.Axis.Z, angle=random_rot_value)  # Extra step.
-                .translate((0, dot_x, 0))  # Extra step.
-            )
+        )
+    ]
 
-    return p
+    for rod_num, (cell_x, dot_offset_x) in enumerate(
+        product(
+            bde.evenly_space_with_center(count=3, spacing=spec.inter_cell_pitch_x),
+            bde.evenly_space_with_center(count=2, spacing=spec.cam_pitch_x),
+        )
+    ):
+        dot_x = cell_x + dot_offset_x
+
+        # Show each rod at a different rotation (deterministic output).
+        rot_value = rod_num * 45
+
+        rods.append(bd.Pos(Y=dot_x) * bd.Rot(Z=rot_value) * rod_with_magnets)
+
+    # The rods don't touch, so group them into one Part without a boolean fuse.
+    return bd.Part(rods)
 
 
 if __name__ == "__main__":
@@ -8,14 +8,13 @@ Conclusion: At 3mm pitch though, Motor OD=4mm, H=8mm motors can totally fit! Jus
 to bend their shafts a bit to make them mate with the screws!
 """
 
-import copy
 import json
-import random
-from dataclasses import dataclass
+from collections.abc import Iterator
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from functools import reduce
 from itertools import product
-from math import sqrt
+from math import atan2, degrees, hypot, sqrt
 from pathlib import Path
 from typing import Literal
 
@@ -125,104 +124,97 @@ class HousingSpec:
             ),
         }
 
-        logger.info(json.dumps(data, indent=2))
+        # Only serialize the data if the message is actually emitted.
+        logger.opt(lazy=True).info("{}", lambda: json.dumps(data, indent=2))
 
     def deep_copy(self) -> "HousingSpec":
         """Copy the current spec."""
-        return copy.deepcopy(self)
+        return replace(self)
+
+
+def iter_dot_grid(
+    spec: HousingSpec,
+) -> Iterator[tuple[float, float, float, float]]:
+    """Iterate over every dot as (cell_x, cell_y, offset_x, offset_y).
+
+    The offsets are unitless (-0.5/0.5 in X, -1/0/1 in Y). Scale them by the motor
+    pitch or dot pitch to get the position.
+    """
+    return product(
+        bde.evenly_space_with_center(
+            count=spec.cell_count_x,
+            spacing=spec.cell_pitch_x,
+        ),
+        bde.evenly_space_with_center(
+            count=spec.cell_count_y,
+            spacing=spec.cell_pitch_y,
+        ),
+        bde.evenly_space_with_center(count=2, spacing=1),
+        bde.evenly_space_with_center(count=3, spacing=1),
+    )
 
 
 def make_motor_placement_demo(spec: HousingSpec) -> bd.Part:
     """Make demo of motor placement."""
     p = bd.Part(None)
 
-    # Create the motor holes.
-    for dot_num, (cell_x, cell_y, offset_x, offset_y) in enumerate(
-        product(
-            bde.evenly_space_with_center(
-                count=spec.cell_count_x,
-                spacing=spec.cell_pitch_x,
-            ),
-            bde.evenly_space_with_center(
-                count=spec.cell_count_y,
-                spacing=spec.cell_pitch_y,
-            ),
-            bde.evenly_space_with_center(count=2, spacing=1),
-            bde.evenly_space_with_center(count=3, spacing=1),
-        ),
-    ):
-        motor_x = cell_x + offset_x * spec.motor_pitch_x
-        motor_y = cell_y + offset_y * spec.motor_pitch_x
-
-        layer_num = dot_num % 2  # 0 (bottom) or 1 (top)
+    layer_pitch_z = spec.motor_body_length + spec.gap_between_motor_layers
 
-        # Create the motor hole.
-        p += bd.Cylinder(
+    # Motor body with its shaft hole, built once per layer and moved into place.
+    motor_per_layer = [
+        bd.Cylinder(
             spec.motor_body_od / 2,
-            # Add a tiny random amount so you can see the edges clearer.
-            spec.motor_body_length + random.random() * 0.2,
+            spec.motor_body_length,
             align=bde.align.ANCHOR_BOTTOM,
-        ).translate(
-            (
-                motor_x,
-                motor_y,
-                (spec.motor_body_length + spec.gap_between_motor_layers) * layer_num,
-            ),
         )
-
-        # Create the motor shaft hole.
-        p += bd.Cylinder(
+        + bd.Cylinder(
             radius=0.25,
             height=(
-                (
-                    spec.motor_body_length + spec.gap_between_motor_layers
-                    if layer_num == 0
-                    else 0
-                )
+                (layer_pitch_z if layer_num == 0 else 0)
                 + (spec.motor_body_length + spec.gap_above_top_motor)
             ),
             align=bde.align.ANCHOR_BOTTOM,
-        ).translate(
-            (
-                motor_x,
-                motor_y,
-                (spec.motor_body_length + spec.gap_between_motor_layers) * layer_num,
-            ),
         )
+        for layer_num in (0, 1)
+    ]
 
-    # Show where the braille dots would be.
-    for cell_x, cell_y, offset_x, offset_y in product(
-        bde.evenly_space_with_center(
-            count=spec.cell_count_x,
-            spacing=spec.cell_pitch_x,
-        ),
-        bde.evenly_space_with_center(
-            count=spec.cell_count_y,
-            spacing=spec.cell_pitch_y,
-        ),
-        bde.evenly_space_with_center(count=2, spacing=spec.dot_pitch_x),
-        bde.evenly_space_with_center(count=3, spacing=spec.dot_pitch_y),
-    ):
-        motor_x = cell_x + offset_x
-        motor_y = cell_y + offset_y
+    # Place all motors, then fuse them in one go.
+    motors: list[bd.Part] = []
+    for dot_num, (cell_x, cell_y, offset_x, offset_y) in enumerate(iter_dot_grid(spec)):
+        motor_x = cell_x + offset_x * spec.motor_pitch_x
+        motor_y = cell_y + offset_y * spec.motor_pitch_x
 
-        # Create the braille dot.
-        p += bd.Cylinder(
-            radius=0.5,
-            height=0.5,
-            align=bde.align.ANCHOR_BOTTOM,
-        ).translate(
-            (
-                motor_x,
-                motor_y,
-                (
-                    (spec.motor_body_length * 2)
-                    + spec.gap_between_motor_layers
-                    + spec.gap_above_top_motor
-                ),
-            )
+        layer_num = dot_num % 2  # 0 (bottom) or 1 (top)
+
+        motors.append(
+            bd.Pos(motor_x, motor_y, layer_pitch_z * layer_num)
+            * motor_per_layer[layer_num],
         )
 
+    p += motors
+
+    # Show where the braille dots would be.
+    cell_grid = bd.GridLocations(
+        x_spacing=spec.cell_pitch_x,
+        y_spacing=spec.cell_pitch_y,
+        x_count=spec.cell_count_x,
+        y_count=spec.cell_count_y,
+    )
+    dot_grid = bd.GridLocations(
+        x_spacing=spec.dot_pitch_x,
+        y_spacing=spec.dot_pitch_y,
+        x_count=2,
+        y_count=3,
+    )
+    dot_locations = bd.Locations(
+        *[cell_loc * dot_loc for cell_loc, dot_loc in product(cell_grid, dot_grid)],
+    )
+    p += dot_locations * bd.Cylinder(
+        radius=0.5,
+        height=0.5,
+        align=bde.align.ANCHOR_BOTTOM,
+    ).translate((0, 0, spec.total_z))
+
     return p
 
 
@@ -242,23 +234,49 @@ def make_motor_housing(spec: HousingSpec) -> bd.Part:
         align=bde.align.ANCHOR_BOTTOM,
     )
 
-    # Create the motor holes.
-    motor_coords_bottom: list[tuple[float, float]] = []
-    motor_coords_top: list[tuple[float, float]] = []
-    for dot_num, (cell_x, cell_y, offset_x, offset_y) in enumerate(
-        product(
-            bde.evenly_space_with_center(
-                count=spec.cell_count_x,
-                spacing=spec.cell_pitch_x,
-            ),
-            bde.evenly_space_with_center(
-                count=spec.cell_count_y,
-                spacing=spec.cell_pitch_y,
+    layer_pitch_z = spec.motor_body_length + spec.gap_between_motor_layers
+
+    # Cutters that are identical for every motor, built once and moved into place.
+    motor_hole_per_layer = [
+        bd.Cylinder(
+            spec.motor_body_od / 2,
+            (
+                spec.motor_body_length
+                if layer_num == 0
+                # Make it stick out on the top
+                else spec.motor_body_length + spec.gap_above_top_motor + 1
             ),
-            bde.evenly_space_with_center(count=2, spacing=1),
-            bde.evenly_space_with_center(count=3, spacing=1),
+            align=bde.align.ANCHOR_BOTTOM,
+        )
+        for layer_num in (0, 1)
+    ]
+    wire_slot = bd.extrude(
+        bd.SlotCenterToCenter(
+            center_separation=(spec.motor_body_od - spec.wire_channel_slot_width),
+            height=spec.wire_channel_slot_width,
         ),
-    ):
+        amount=spec.gap_between_motor_layers,
+    ).rotate(axis=bd.Axis.Z, angle=90)
+    wire_through = bd.extrude(
+        bd.Circle(radius=spec.wire_channel_slot_width / 2),
+        amount=layer_pitch_z,
+    )
+    turner_tube_bottom = bd.extrude(
+        bd.Circle(
+            radius=spec.turner_tube_od / 2,
+        ),
+        amount=spec.motor_rigid_shaft_len + 0.01,
+    )
+
+    # Create the motor holes. Collect the cutters for each role, then remove each
+    # role in one cut.
+    motor_coords_bottom: list[tuple[float, float]] = []
+    motor_coords_top: list[tuple[float, float]] = []
+    motor_holes: list[bd.Part] = []
+    wire_slots: list[bd.Part] = []
+    wire_throughs: list[bd.Part] = []
+    turner_tubes: list[bd.Part] = []
+    for dot_num, (cell_x, cell_y, offset_x, offset_y) in enumerate(iter_dot_grid(spec)):
         motor_x = cell_x + offset_x * spec.motor_pitch_x
         motor_y = cell_y + offset_y * spec.motor_pitch_y
         dot_x = cell_x + offset_x * spec.dot_pitch_x
@@ -276,103 +294,67 @@ def make_motor_housing(spec: HousingSpec) -> bd.Part:
             raise ValueError(msg)
 
         # Create the motor hole.
-        p -= bd.Cylinder(
-            spec.motor_body_od / 2,
-            (
-                spec.motor_body_length
-                if layer_num == 0
-                # Make it stick out on the top
-                else spec.motor_body_length + spec.gap_above_top_motor + 1
-            ),
-            align=bde.align.ANCHOR_BOTTOM,
-        ).translate(
-            (
-                motor_x,
-                motor_y,
-                (spec.motor_body_length + spec.gap_between_motor_layers) * layer_num,
-            ),
+        motor_holes.append(
+            bd.Pos(motor_x, motor_y, layer_pitch_z * layer_num)
+            * motor_hole_per_layer[layer_num]
         )
 
         # Remove the hole for the wires.
         if layer_num == 1:  # Top motor layer only.
             # In gap between motor layers.
-            p -= (
-                bd.extrude(
-                    bd.SlotCenterToCenter(
-                        center_separation=(
-                            spec.motor_body_od - spec.wire_channel_slot_width
-                        ),
-                        height=spec.wire_channel_slot_width,
-                    ),
-                    amount=spec.gap_between_motor_layers,
-                )
-                .rotate(axis=bd.Axis.Z, angle=90)
-                .translate(
-                    (
-                        motor_x,
-                        motor_y,
-                        spec.motor_body_length + spec.gap_between_motor_layers / 2,
-                    )
+            wire_slots.append(
+                bd.Pos(
+                    motor_x,
+                    motor_y,
+                    spec.motor_body_length + spec.gap_between_motor_layers / 2,
                 )
+                * wire_slot
             )
 
             # Through to bottom.
             # For non-middle dots (i.e., Dot 4, 6), the wire channel through to the
             # bottom goes toward the center of the housing.
-            p -= bd.extrude(
-                bd.Circle(radius=spec.wire_channel_slot_width / 2),
-                amount=spec.motor_body_length + spec.gap_between_motor_layers,
-            ).translate(
-                (
-                    motor_x,
-                    (
-                        motor_y
-                        + (
-                            # Offset it in by 1mm so it is contained in the hull.
-                            -offset_y * 0.5
-                            if spec.remove_thin_walls
-                            # Else: Offset it toward edge.
-                            else (
-                                offset_y
-                                * (
-                                    spec.motor_body_od / 2
-                                    - spec.wire_channel_slot_width / 2
-                                    - 0.2
-                                )
-                            )
-                        )
-                    ),
-                    0,
+            wire_through_y = motor_y + (
+                # Offset it in by 1mm so it is contained in the hull.
+                -offset_y * 0.5
+                if spec.remove_thin_walls
+                # Else: Offset it toward edge.
+                else (
+                    offset_y
+                    * (spec.motor_body_od / 2 - spec.wire_channel_slot_width / 2 - 0.2)
                 )
             )
+            wire_throughs.append(bd.Pos(motor_x, wire_through_y) * wire_through)
 
         # Create the turner_tube hole, with passage right to the dot.
         if layer_num == 0:  # Bottom only.
-            p -= bd.extrude(
-                bd.make_hull(
-                    bd.Circle(
-                        radius=spec.turner_tube_od / 2,
-                    )
-                    .translate((motor_x, motor_y))
-                    .edges()
-                    # ----
-                    + bd.Circle(
-                        radius=spec.turner_tube_od / 2,
-                    )
-                    .translate((dot_x, dot_y))
-                    .edges()
-                ),
-                amount=spec.motor_body_length + spec.gap_between_motor_layers,
-            ).translate((0, 0, spec.motor_body_length + spec.motor_rigid_shaft_len))
+            # The hull of two equal circles is a slot from the motor to the dot.
+            turner_tubes.append(
+                bd.Pos(
+                    (motor_x + dot_x) / 2,
+                    (motor_y + dot_y) / 2,
+                    spec.motor_body_length + spec.motor_rigid_shaft_len,
+                )
+                * bd.Rot(Z=degrees(atan2(dot_y - motor_y, dot_x - motor_x)))
+                * bd.extrude(
+                    bd.SlotCenterToCenter(
+                        center_separation=hypot(dot_x - motor_x, dot_y - motor_y),
+                        height=spec.turner_tube_od,
+                    ),
+                    amount=layer_pitch_z,
+                )
+            )
 
             # Bottom part is just a cylinder, from top of bottom motor,
             # up `spec.motor_body_length` amount into/past the gap_between_motor_layers.
-            p -= bd.extrude(
-                bd.Circle(
-                    radius=spec.turner_tube_od / 2,
-                ),
-                amount=spec.motor_rigid_shaft_len + 0.01,
-            ).translate((motor_x, motor_y, spec.motor_body_length))
+            turner_tubes.append(
+                bd.Pos(motor_x, motor_y, spec.motor_body_length) * turner_tube_bottom
+            )
+
+    p -= motor_holes
+    p -= wire_slots
+    p -= wire_throughs
+    p -= turner_tubes
 
     if spec.remove_thin_walls:
         # Subtract a hull of the centers of the motor holes (TOP layer).
@@ -418,15 +400,18 @@ def make_motor_housing(spec: HousingSpec) -> bd.Part:
         ).translate((0, 0, -spec.motor_outline_thickness_z))
 
     # Subtract the mounting holes.
-    for hole_x, hole_y in product(
-        bde.evenly_space_with_center(count=2, spacing=spec.mounting_hole_spacing_x),
-        bde.evenly_space_with_center(count=3, spacing=spec.mounting_hole_spacing_y),
-    ):
-        p -= bd.Cylinder(
-            spec.mounting_hole_diameter / 2,
-            spec.total_z,
-            align=bde.align.ANCHOR_BOTTOM,
-        ).translate((hole_x, hole_y, 0))
+    mounting_hole = bd.Cylinder(
+        spec.mounting_hole_diameter / 2,
+        spec.total_z,
+        align=bde.align.ANCHOR_BOTTOM,
+    )
+    p -= [
+        bd.Pos(hole_x, hole_y) * mounting_hole
+        for hole_x, hole_y in product(
+            bde.evenly_space_with_center(count=2, spacing=spec.mounting_hole_spacing_x),
+            bde.evenly_space_with_center(count=3, spacing=spec.mounting_hole_spacing_y),
+        )
+    ]
 
     # Subtract the gap_above_top_motor.
     p -= bd.Box(
@@ -505,20 +490,9 @@ def make_top_plate_for_tapping(
     )
 
     # Create the dots.
-    for cell_x, cell_y, dot_offset_x, dot_offset_y in product(
-        bde.evenly_space_with_center(
-            count=spec.cell_count_x,
-            spacing=spec.cell_pitch_x,
-        ),
-        bde.evenly_space_with_center(
-            count=spec.cell_count_y,
-            spacing=spec.cell_pitch_y,
-        ),
-        bde.evenly_space_with_center(count=2, spacing=spec.dot_pitch_x),
-        bde.evenly_space_with_center(count=3, spacing=spec.dot_pitch_y),
-    ):
-        dot_x = cell_x + dot_offset_x
-        dot_y = cell_y + dot_offset_y
+    for cell_x, cell_y, offset_x, offset_y in iter_dot_grid(spec):
+        dot_x = cell_x + offset_x * spec.dot_pitch_x
+        dot_y = cell_y + offset_y * spec.dot_pitch_y
 
         if tap_holes:
             p -= bd.Cylinder(
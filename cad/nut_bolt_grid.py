@@ -13,6 +13,7 @@ Conclusion:
 - Use threaded holes in an aluminum plate instead of nuts!
 """
 
+import functools
 import itertools
 import json
 from dataclasses import dataclass
@@ -44,7 +45,11 @@ m1p4_nut = NutSpec(width=2.9, thickness=1.1, m_diameter=1.4)
 
 @dataclass
 class NutHolderSpec:
-    """Dimensions and generator for the nut holder."""
+    """Dimensions and generator for the nut holder.
+
+    The derived layout values are cached on first access, so don't change the
+    fields after construction.
+    """
 
     nut: NutSpec
 
@@ -80,7 +85,7 @@ class NutHolderSpec:
     mount_screw_standoff_d: float = 6
     mount_screw_standoff_height: float = 5
 
-    @property
+    @functools.cached_property
     def min_max_x_dot_center(self) -> tuple[float, float]:
         """Get the min and max x values for the dot centers."""
         return (
@@ -88,7 +93,7 @@ class NutHolderSpec:
             max(x[0] for x in self.dot_centers),
         )
 
-    @property
+    @functools.cached_property
     def min_max_y_dot_center(self) -> tuple[float, float]:
         """Get the min and max y values for the dot centers."""
         return (
@@ -96,14 +101,14 @@ class NutHolderSpec:
             max(x[1] for x in self.dot_centers),
         )
 
-    @property
+    @functools.cached_property
     def total_width(self) -> float:
         """Total width of the nut holder."""
         return self.border_thickness_xy * 2 + (
             self.min_max_x_dot_center[1] - self.min_max_x_dot_center[0]
         )
 
-    @property
+    @functools.cached_property
     def total_height(self) -> float:
         """Total height of the nut holder."""
         return self.border_thickness_xy * 2 + (
@@ -120,7 +125,7 @@ class NutHolderSpec:
             + 2 * self.nut.thickness
         )
 
-    @property
+    @functools.cached_property
     def cell_centers(self) -> list[tuple[float, float]]:
         """Get the centers of the cells."""
         return [
@@ -132,7 +137,7 @@ class NutHolderSpec:
             for x_num in range(self.cell_count_x)
         ]
 
-    @property
+    @functools.cached_property
     def dot_centers(self) -> list[tuple[float, float, int]]:
         """Get the centers of the dots.
 
@@ -156,12 +161,12 @@ class NutHolderSpec:
             for cell_coord in self.cell_centers
         ]
 
-    @property
+    @functools.cached_property
     def mounting_hole_sep_x(self) -> float:
         """Get the x separation between the centers of the mounting holes."""
         return self.total_width - self.mount_screw_standoff_d
 
-    @property
+    @functools.cached_property
     def mounting_hole_sep_y(self) -> float:
         """Get the y separation between the centers of the mounting holes."""
         return self.total_height - self.mount_screw_standoff_d
@@ -185,7 +190,10 @@ class NutHolderSpec:
             "mounting_hole_sep_y": self.mounting_hole_sep_y,
         }
 
-        logger.success(f"Dimensions validated: {json.dumps(data, indent=4)}")
+        # Only serialize the data if the message is actually emitted.
+        logger.opt(lazy=True).success(
+            "Dimensions validated: {}", lambda: json.dumps(data, indent=4)
+        )
 
 
 def make_nut_holder(nut_holder_spec: NutHolderSpec) -> bd.Part:
@@ -201,7 +209,37 @@ def make_nut_holder(nut_holder_spec: NutHolderSpec) -> bd.Part:
 
     box_bottom_z = bde.bottom_face_of(p).center().Z
 
-    # Make the nuts.
+    # Build the cutters once. The nut only has two orientations, and the screw hole
+    # is symmetric, so it has one.
+    nut_cutters = {
+        rotate_nut_direction: (
+            bd.extrude(
+                bd.RegularPolygon(
+                    radius=nut_holder_spec.nut.width / 2,
+                    side_count=6,
+                    major_radius=False,
+                ),
+                amount=nut_holder_spec.total_thickness
+                * 2,  # Extrude it through the brick.
+            )
+            .translate((0, 0, -nut_holder_spec.nut.thickness / 2))  # Center the nut.
+            .rotate(axis=bd.Axis.Z, angle=nut_holder_spec.nut_rotate_z)
+            .rotate(axis=bd.Axis.X, angle=rotate_nut_direction)
+        )
+        for rotate_nut_direction in (0, 180)
+    }
+    screw_hole = bd.Cylinder(
+        radius=(
+            nut_holder_spec.nut.m_diameter / 2
+            + nut_holder_spec.screw_extra_diameter / 2
+        ),
+        # Extrude it through the brick.
+        height=nut_holder_spec.total_thickness * 2.5,
+    )
+
+    # Make the nuts. Collect the nut and screw hole cutters, then remove them all in
+    # one cut.
+    cutters: list[bd.Part] = []
     for x, y, dot_num in nut_holder_spec.dot_centers:
         nut_center_z = (
             box_bottom_z
@@ -218,62 +256,33 @@ def make_nut_holder(nut_holder_spec: NutHolderSpec) -> bd.Part:
         elif nut_holder_spec.nut_from_top_or_bottom == "bottom":
             rotate_nut_direction = 180
 
-        # Remove the nut.
-        p -= (
-            bd.extrude(
-                bd.RegularPolygon(
-                    radius=nut_holder_spec.nut.width / 2,
-                    side_count=6,
-                    major_radius=False,
-                ),
-                amount=nut_holder_spec.total_thickness
-                * 2,  # Extrude it through the brick.
-            )
-            .translate((0, 0, -nut_holder_spec.nut.thickness / 2))  # Center the nut.
-            .rotate(axis=bd.Axis.Z, angle=nut_holder_spec.nut_rotate_z)
-            .rotate(axis=bd.Axis.X, angle=rotate_nut_direction)
-            .translate((x, y, nut_center_z))
-        )
+        # Remove the nut and the screw hole.
+        cutters.append(bd.Pos(x, y, nut_center_z) * nut_cutters[rotate_nut_direction])
+        cutters.append(bd.Pos(x, y, nut_center_z) * screw_hole)
 
-        # Remove the screw hole.
-        p -= (
-            bd.Cylinder(
-                radius=(
-                    nut_holder_spec.nut.m_diameter / 2
-                    + nut_holder_spec.screw_extra_diameter / 2
-                ),
-                # Extrude it through the brick.
-                height=nut_holder_spec.total_thickness * 2.5,
-            )
-            .rotate(axis=bd.Axis.X, angle=rotate_nut_direction)
-            .translate((x, y, nut_center_z))
-        )
+    p -= cutters
 
-    # Add the standoffs out the bottom.
-    for x, y in itertools.product([-1, 1], [-1, 1]):
-        p += bd.Cylinder(
-            radius=nut_holder_spec.mount_screw_standoff_d / 2,
-            height=nut_holder_spec.mount_screw_standoff_height,
-            align=bde.align.ANCHOR_BOTTOM,  # Normal.
-            rotation=bde.rotation.NEG_Z,
-        ).translate(
+    # Add the standoffs out the bottom, then remove the screw holes through them.
+    mounting_locations = bd.Locations(
+        *[
             (
                 x * nut_holder_spec.mounting_hole_sep_x / 2,
                 y * nut_holder_spec.mounting_hole_sep_y / 2,
-                box_bottom_z,
-            ),
-        )
-
-        p -= bd.Cylinder(
-            radius=nut_holder_spec.mount_screw_d / 2,
-            height=100,
-        ).translate(
-            (
-                x * nut_holder_spec.mounting_hole_sep_x / 2,
-                y * nut_holder_spec.mounting_hole_sep_y / 2,
-                0,
-            ),
-        )
+            )
+            for x, y in itertools.product([-1, 1], [-1, 1])
+        ]
+    )
+    p += mounting_locations * bd.Cylinder(
+        radius=nut_holder_spec.mount_screw_standoff_d / 2,
+        height=nut_holder_spec.mount_screw_standoff_height,
+        align=bde.align.ANCHOR_BOTTOM,  # Normal.
+        rotation=bde.rotation.NEG_Z,
+    ).translate((0, 0, box_bottom_z))
+
+    p -= mounting_locations * bd.Cylinder(
+        radius=nut_holder_spec.mount_screw_d / 2,
+        height=100,
+    )
 
     return p
 
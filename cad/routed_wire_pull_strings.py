@@ -4,6 +4,8 @@ This idea uses wires/threads routed through channels in the housing to pull the
 and down.
 """
 
+import argparse
+import functools
 import json
 import math
 from pathlib import Path
@@ -69,6 +71,11 @@ housing_size_y = inter_cell_dot_pitch_y + 3.3
 # Includes roof and basement.
 housing_size_z = pogo_length + pogo_below_flange_length + housing_basement_thickness
 
+# Cable channel offset from the dot center, as a fraction of the dot separation.
+# Note: This is cos(45 rad) ~= 0.525, not cos(45 deg). The channel layout
+# (incl. the bottom exits lining up with the channels) is tuned to it.
+housing_cable_channel_offset_factor = math.cos(45)
+
 
 # Calculated motor base plate dimensions.
 motor_base_plate_y_size = (
@@ -106,43 +113,39 @@ def validate_dimensions_and_info() -> None:
     logger.info("Dimensions validated.")
 
 
+@functools.lru_cache(maxsize=8)
 def make_pogo_pin(pogo_throw_tip_od_delta: float = 0) -> bd.Part:
     """Make a pogo pin to act as a negative for the print-in-place surrounding part.
 
     * Orientation: Pin extends up.
     * Origin (XY): Center of bottom of flange. `pogo_length` extends up.
+    * Cached: the same Part is returned for the same args. Don't modify it in place.
     """
-    with bd.BuildPart() as pogo_pin_part:
-        # Below flange.
-        bd.Cylinder(
-            radius=pogo_below_flange_od / 2,
-            height=pogo_below_flange_length,
-            align=(bd.Align.CENTER, bd.Align.CENTER, bd.Align.MAX),
-        )
-
-        # Flange.
-        bd.Cylinder(
-            radius=pogo_flange_od / 2,
-            height=pogo_flange_length,
-            align=(bd.Align.CENTER, bd.Align.CENTER, bd.Align.MIN),
-        )
-
-        # Shaft.
-        bd.Cylinder(
-            radius=pogo_shaft_od / 2,
-            height=pogo_shaft_length,
-            align=(bd.Align.CENTER, bd.Align.CENTER, bd.Align.MIN),
-        )
-
-        # Throw/tip.
-        with bd.Locations(pogo_pin_part.faces().sort_by(bd.Axis.Z)[-1]):
-            bd.Cylinder(
-                radius=(pogo_throw_tip_od + pogo_throw_tip_od_delta) / 2,
-                height=pogo_throw_length,
-                align=(bd.Align.CENTER, bd.Align.CENTER, bd.Align.MIN),
-            )
+    throw_tip_r = (pogo_throw_tip_od + pogo_throw_tip_od_delta) / 2
+    top_z = pogo_shaft_length + pogo_throw_length
+
+    # Stepped (radius, Z) half cross-section, revolved around the Z axis.
+    profile = bd.Polygon(
+        [
+            # Below flange.
+            (0, -pogo_below_flange_length),
+            (pogo_below_flange_od / 2, -pogo_below_flange_length),
+            (pogo_below_flange_od / 2, 0),
+            # Flange.
+            (pogo_flange_od / 2, 0),
+            (pogo_flange_od / 2, pogo_flange_length),
+            # Shaft (starts at the bottom of the flange, like the flange).
+            (pogo_shaft_od / 2, pogo_flange_length),
+            (pogo_shaft_od / 2, pogo_shaft_length),
+            # Throw/tip, on top of the shaft.
+            (throw_tip_r, pogo_shaft_length),
+            (throw_tip_r, top_z),
+            (0, top_z),
+        ],
+        align=None,
+    )
 
-    return pogo_pin_part.part
+    return bd.revolve(bd.Plane.XZ * profile, axis=bd.Axis.Z)
 
 
 def make_housing() -> bd.Part:
@@ -160,48 +163,60 @@ def make_housing() -> bd.Part:
         height=housing_size_z,
         align=bd.Align.CENTER,
     )
-    box_top_face = part.faces().sort_by(bd.Axis.Z)[-1]
-    box_bottom_face = part.faces().sort_by(bd.Axis.Z)[0]
+    # Box is centered, so its faces are known without querying the topology.
+    top_z = housing_size_z / 2
+    bottom_center = bd.Vector(0, 0, -housing_size_z / 2)
+    bottom_max_y = housing_size_y / 2
 
     # Remove the pogo pin holes. Set the Z by making the pogo pin stick out
     # the perfect amount to get `dot_height` above the top face.
-    part -= dot_center_grid_locations * make_pogo_pin(
-        pogo_throw_tip_od_delta=0.5,
-    ).translate(
-        (
-            0,
-            0,
-            box_top_face.center().Z - pogo_length + dot_height,
-        ),
-    )
+    pogo_pin_offset = bd.Pos(Z=top_z - pogo_length + dot_height)
+    part -= [
+        grid_pos * pogo_pin_offset * make_pogo_pin(pogo_throw_tip_od_delta=0.5)
+        for grid_pos in dot_center_grid_locations
+    ]
 
     # Remove small cable channels which go all the way to the roof.
+    # Compose the location first, so each channel is only copied/moved once.
+    channel_offsets = [
+        bd.Pos(
+            offset * housing_cable_channel_offset_factor * dot_separation_x,
+            offset * housing_cable_channel_offset_factor * dot_separation_y,
+            top_z,
+        )
+        for offset in (-1, 1)
+    ]
+    # Create a channel out through the bottom. Built once, then placed per dot.
+    cable_channel = make_curved_bent_cylinder(
+        diameter=housing_cable_channel_od,
+        vertical_seg_length=pogo_length - dot_height,
+        horizontal_seg_length=housing_size_y,
+        bend_radius=3,
+    )
     for idx1, grid_pos in enumerate(dot_center_grid_locations):
-        for offset in (-1, 1):
-            # Create a channel out through the bottom.
-            # Do this `idx * 0.0001` to avoid overlapping/self-intersecting geometry.
-            cable_channel = make_curved_bent_cylinder(
-                diameter=housing_cable_channel_od + (idx1 * 0.0001),
-                vertical_seg_length=(pogo_length - dot_height) + (idx1 * 0.0001),
-                horizontal_seg_length=housing_size_y,
-                bend_radius=3 + (idx1 * 0.0001),
-            )
-
-            part -= grid_pos * cable_channel.translate(
-                (
-                    offset * math.cos(45) * dot_separation_x,
-                    offset * math.cos(45) * dot_separation_y,
-                    box_top_face.center().Z,
-                ),
-            )
-
-            logger.info(f"Cable channel {idx1} added.")
-
-    # Remove the channels out the bottom.
+        # Raise by `idx * 0.0001` to avoid overlapping/self-intersecting geometry
+        # (channels in the same column share their horizontal segment).
+        # The two channels of one dot are disjoint, so cut them in one boolean.
+        idx_nudge = bd.Pos(Z=idx1 * 0.0001)
+        part -= [
+            grid_pos * channel_offset * idx_nudge * cable_channel
+            for channel_offset in channel_offsets
+        ]
+
+    logger.debug(f"Cable channels added: {2 * dot_x_count * dot_y_count}")
+
+    # Remove the channels out the bottom. All are the same height, so sketch
+    # their footprints and extrude them together.
+    bottom_exit_sketch = bd.Sketch()
     for x_multiplier in [-1, 0, 1]:
-        channel_center_x = x_multiplier * math.cos(45) * dot_separation_x * 2
+        channel_center_x = (
+            x_multiplier * housing_cable_channel_offset_factor * dot_separation_x * 2
+        )
 
-        part -= bd.Box(
+        bottom_exit_sketch += bd.Pos(
+            bottom_center.X + channel_center_x,
+            bottom_max_y,
+        ) * bd.Rectangle(
             housing_cable_channel_od + 0.01,
             (
                 housing_size_y / 2  # Get to middle of housing
@@ -211,22 +226,23 @@ def make_housing() -> bd.Part:
                 )
                 + (
                     # Get to the center of the channel
-                    math.cos(45) * dot_separation_y
+                    housing_cable_channel_offset_factor * dot_separation_y
                 )
             ),
-            housing_size_z - pogo_length + dot_height + housing_cable_channel_od * 0.4,
-            align=(bd.Align.CENTER, bd.Align.MAX, bd.Align.MIN),
-        ).translate(
-            (
-                box_bottom_face.center().X + channel_center_x,
-                box_bottom_face.bounding_box().max.Y,
-                box_bottom_face.center().Z,
-            ),
+            align=(bd.Align.CENTER, bd.Align.MAX),
         )
 
+    bottom_exits = bd.extrude(
+        bottom_exit_sketch,
+        amount=housing_size_z
+        - pogo_length
+        + dot_height
+        + housing_cable_channel_od * 0.4,
+    ).translate((0, 0, bottom_center.Z))
+
     # Add mounting screw holes.
-    for offset in (-1, 1):
-        part -= bd.Cylinder(
+    mounting_holes = [
+        bd.Cylinder(
             radius=housing_mounting_screw_od / 2,
             height=housing_size_z,
             align=(bd.Align.CENTER, bd.Align.CENTER, bd.Align.MIN),
@@ -234,9 +250,13 @@ def make_housing() -> bd.Part:
             (
                 offset * (dot_separation_x / 2),  # Align to avoid cable channels.
                 offset * housing_mounting_screw_sep_y / 2,
-                box_bottom_face.center().Z,
+                bottom_center.Z,
             ),
         )
+        for offset in (-1, 1)
+    ]
+
+    part -= [bottom_exits, *mounting_holes]
 
     return part
 
@@ -262,8 +282,8 @@ def make_housing_chain(cell_count: int) -> bd.Part:
         )
 
     # Add on edge plates.
-    chain_min_x = part.faces().sort_by(bd.Axis.X)[0].center().X
-    chain_max_x = part.faces().sort_by(bd.Axis.X)[-1].center().X
+    chain_min_x = -housing_size_x / 2
+    chain_max_x = (cell_count - 1) * inter_cell_dot_pitch_x + housing_size_x / 2
 
     for x, mount_align in ((chain_min_x, bd.Align.MAX), (chain_max_x, bd.Align.MIN)):
         part += bd.Box(
@@ -288,19 +308,16 @@ def make_motor_base(cell_count: int) -> bd.Part:
         align=(bd.Align.CENTER, bd.Align.CENTER, bd.Align.MAX),
     )
 
-    base_bottom_face = part.faces().sort_by(bd.Axis.Z)[0]
-    base_back_face = part.faces().sort_by(bd.Axis.Y)[-1]
-    base_front_face = part.faces().sort_by(bd.Axis.Y)[0]
+    # Base is centered in XY with its top at Z=0, so its faces are known.
+    base_bottom_z = -motor_base_plate_thickness
+    base_back_y = motor_base_plate_y_size / 2
+    base_front_y = -motor_base_plate_y_size / 2
 
     # Add mounting holes for the cells.
     cell_num_offset = -((cell_count / 2) - 0.5)
     for cell_num in range(cell_count):
-        center_of_cell_x = (
-            # Get to the center of the box
-            base_bottom_face.center().X
-            # Then move to the center of the cell
-            + (cell_num_offset + cell_num) * inter_cell_dot_pitch_x
-        )
+        # Center of the cell, relative to the center of the box (X=0).
+        center_of_cell_x = (cell_num_offset + cell_num) * inter_cell_dot_pitch_x
 
         for offset in (-1, 1):
             part -= (
@@ -313,7 +330,7 @@ def make_motor_base(cell_count: int) -> bd.Part:
                     (
                         offset * (dot_separation_x / 2),
                         offset * housing_mounting_screw_sep_y / 2,
-                        base_bottom_face.center().Z,
+                        base_bottom_z,
                     ),
                 )
                 .translate(
@@ -321,7 +338,7 @@ def make_motor_base(cell_count: int) -> bd.Part:
                         (center_of_cell_x),
                         (
                             # Get to the back of the box
-                            base_back_face.center().Y
+                            base_back_y
                             # Then move forward to the center of the cell
                             - (housing_size_y / 2)
                         ),
@@ -345,8 +362,8 @@ def make_motor_base(cell_count: int) -> bd.Part:
         ).translate(
             (
                 center_of_cell_x,
-                base_front_face.center().Y,
-                base_bottom_face.center().Z + motor_raise_from_bottom_of_base,
+                base_front_y,
+                base_bottom_z + motor_raise_from_bottom_of_base,
             ),
         )
 
@@ -362,12 +379,12 @@ def make_motor_base(cell_count: int) -> bd.Part:
                     center_of_cell_x,
                     (
                         # Get to the front of the box.
-                        base_front_face.center().Y
+                        base_front_y
                         # Then move backwards by the motor count.
                         + ((motor_num + 0.5) * (motor_od + motor_space_between_motors))
                     ),
                     (
-                        base_bottom_face.center().Z
+                        base_bottom_z
                         + motor_raise_from_bottom_of_base
                         + (0.0001 * motor_num)  # Avoid overlapping geometry.
                     ),
@@ -382,6 +399,15 @@ def make_motor_base(cell_count: int) -> bd.Part:
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--no-stl", action="store_true", help="Skip STL export.")
+    parser.add_argument(
+        "--no-step",
+        action="store_true",
+        help="Skip STEP export (much slower than STL).",
+    )
+    args = parser.parse_args()
+
     validate_dimensions_and_info()
 
     parts = {
@@ -399,5 +425,7 @@ if __name__ == "__main__":
         export_folder := Path(__file__).parent.parent / "build" / Path(__file__).stem
     ).mkdir(exist_ok=True, parents=True)
     for name, part in parts.items():
-        bd.export_stl(part, str(export_folder / f"{name}.stl"))
-        bd.export_step(part, str(export_folder / f"{name}.step"))
+        if not args.no_stl:
+            bd.export_stl(part, str(export_folder / f"{name}.stl"))
+        if not args.no_step:
+            bd.export_step(part, str(export_folder / f"{name}.step"))
@@ -85,50 +85,39 @@ def make_base_plate(spec: BasePlateSpec) -> bd.Part:
         align=bde.align.ANCHOR_BOTTOM,
     )
 
-    for cell_x, cell_y in product(
-        bde.evenly_space_with_center(
-            count=spec.cell_count_x, spacing=spec.cell_pitch_x
-        ),
-        bde.evenly_space_with_center(
-            count=spec.cell_count_y, spacing=spec.cell_pitch_y
-        ),
-    ):
-        for dot_x, dot_y in product(
-            bde.evenly_space_with_center(
-                center=cell_x,
-                count=spec.dot_count_x,
-                spacing=spec.dot_pitch_x,
-            ),
-            bde.evenly_space_with_center(
-                center=cell_y,
-                count=spec.dot_count_y,
-                spacing=spec.dot_pitch_y,
-            ),
-        ):
-            p += bd.Cylinder(
-                spec.solenoid_core_od / 2,
-                spec.solenoid_core_height,
-                align=bde.align.ANCHOR_BOTTOM,
-            ).translate((dot_x, dot_y, spec.base_plate_thickness))
-
-            # Remove iron core.
-            p -= bd.Cylinder(
-                spec.solenoid_core_id / 2,
-                spec.solenoid_core_height + spec.base_plate_thickness,
-                align=bde.align.ANCHOR_BOTTOM,
-            ).translate((dot_x, dot_y, spec.base_plate_thickness))
+    cell_grid = bd.GridLocations(
+        x_spacing=spec.cell_pitch_x,
+        y_spacing=spec.cell_pitch_y,
+        x_count=spec.cell_count_x,
+        y_count=spec.cell_count_y,
+    )
+    dot_grid = bd.GridLocations(
+        x_spacing=spec.dot_pitch_x,
+        y_spacing=spec.dot_pitch_y,
+        x_count=spec.dot_count_x,
+        y_count=spec.dot_count_y,
+    )
+    tube_locations = bd.Locations(
+        *[cell_loc * dot_loc for cell_loc, dot_loc in product(cell_grid, dot_grid)],
+    )
+
+    # Tube walls, with the iron core already removed (annulus).
+    tube_sketch = tube_locations * (
+        bd.Circle(spec.solenoid_core_od / 2) - bd.Circle(spec.solenoid_core_id / 2)
+    )
+    p += bd.extrude(
+        bd.Sketch() + tube_sketch,
+        amount=spec.solenoid_core_height,
+    ).translate((0, 0, spec.base_plate_thickness))
 
     # Add protection walls.
-    p += bd.Box(
-        spec.total_x,
-        spec.total_y,
-        spec.base_plate_thickness + spec.protection_wall_height,
-        align=bde.align.ANCHOR_BOTTOM,
-    ) - bd.Box(
-        spec.total_x - 2 * spec.protection_wall_thickness,
-        spec.total_y - 2 * spec.protection_wall_thickness,
-        spec.base_plate_thickness + spec.protection_wall_height,
-        align=bde.align.ANCHOR_BOTTOM,
+    p += bd.extrude(
+        bd.Rectangle(spec.total_x, spec.total_y)
+        - bd.Rectangle(
+            spec.total_x - 2 * spec.protection_wall_thickness,
+            spec.total_y - 2 * spec.protection_wall_thickness,
+        ),
+        amount=spec.base_plate_thickness + spec.protection_wall_height,
     )
 
     return p
@@ -175,55 +164,48 @@ class SpoolSpec:
 
 
 def make_solenoid_spool(spec: SpoolSpec) -> bd.Part:
-    """Make a spool for the solenoid."""
-    p = bd.Part(None)
-
-    p += bd.Cylinder(
-        spec.spool_core_od / 2,
-        spec.total_length,
-        align=bde.align.ANCHOR_CENTER,
+    """Make a spool for the solenoid.
+
+    Built as one (radius, Z) half cross-section, revolved around the Z axis.
+    The grip base is only on the -Z end.
+    """
+    core_r = spec.spool_core_od / 2
+    core_end_z = spec.total_length / 2
+    flange_inner_z = spec.spool_core_height / 2
+    flange_outer_z = flange_inner_z + spec.flange_thickness
+    grip_base_top_z = -(flange_outer_z + spec.dist_between_flange_to_base)
+    grip_base_bottom_z = grip_base_top_z - spec.grip_base_thickness
+    bore_end_z = flange_outer_z + 1  # Hole runs 1mm past each flange.
+
+    profile = bd.Polygon(
+        [
+            # Grip base (-Z end).
+            (0, grip_base_bottom_z),
+            (spec.grip_base_diameter / 2, grip_base_bottom_z),
+            (spec.grip_base_diameter / 2, grip_base_top_z),
+            (core_r, grip_base_top_z),
+            # Bottom flange.
+            (core_r, -flange_outer_z),
+            (spec.flange_diameter / 2, -flange_outer_z),
+            (spec.flange_diameter / 2, -flange_inner_z),
+            (core_r, -flange_inner_z),
+            # Top flange.
+            (core_r, flange_inner_z),
+            (spec.flange_diameter / 2, flange_inner_z),
+            (spec.flange_diameter / 2, flange_outer_z),
+            (core_r, flange_outer_z),
+            # Top of core, then back down through the core hole.
+            (core_r, core_end_z),
+            (0, core_end_z),
+            (0, bore_end_z),
+            (spec.spool_core_id / 2, bore_end_z),
+            (spec.spool_core_id / 2, -bore_end_z),
+            (0, -bore_end_z),
+        ],
+        align=None,
     )
 
-    for side in [1, -1]:
-        # Add the flanges.
-        p += bd.Cylinder(
-            spec.flange_diameter / 2,
-            spec.flange_thickness,
-            align=bde.align.ANCHOR_CENTER,
-        ).translate(
-            (
-                0,
-                0,
-                side * (spec.spool_core_height / 2 + spec.flange_thickness / 2),
-            ),
-        )
-
-        # Add the grip base.
-        if side == -1:
-            p += bd.Cylinder(
-                spec.grip_base_diameter / 2,
-                spec.grip_base_thickness,
-                align=bde.align.ANCHOR_CENTER,
-            ).translate(
-                (
-                    0,
-                    0,
-                    side
-                    * (
-                        spec.spool_core_height / 2
-                        + spec.flange_thickness
-                        + spec.dist_between_flange_to_base
-                        + spec.grip_base_thickness / 2
-                    ),
-                ),
-            )
-
-    # Remove the core.
-    p -= bd.Cylinder(
-        spec.spool_core_id / 2,
-        spec.spool_core_height + spec.flange_thickness * 2 + 2,
-        align=bde.align.ANCHOR_CENTER,
-    )
+    p = bd.revolve(bd.Plane.XZ * profile, axis=bd.Axis.Z)
 
     return p
 
@@ -4,9 +4,7 @@ Has a spot for one cylinder to stay in place on one end, and a spot for a braill
 on the other end.
 """
 
-import copy
-import json
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime
 from itertools import product
 from pathlib import Path
@@ -29,14 +27,9 @@ class MainSpec:
 
     base_thickness: float = 0.5
 
-    def __post_init__(self) -> None:
-        """Post initialization checks."""
-        data = {}
-        logger.info(json.dumps(data, indent=2))
-
     def deep_copy(self) -> "MainSpec":
         """Copy the current spec."""
-        return copy.deepcopy(self)
+        return replace(self)
 
 
 def make_magnet_aligner(spec: MainSpec) -> bd.Part:
@@ -62,16 +55,24 @@ def make_magnet_aligner(spec: MainSpec) -> bd.Part:
         align=bde.align.ANCHOR_BOTTOM,
     )
 
-    # At the other end, create a braille cell.
-    for dot_x, dot_y in product(
-        bde.evenly_space_with_center(count=2, spacing=spec.dot_pitch),
-        bde.evenly_space_with_center(count=3, spacing=spec.dot_pitch, center=20 - 5),
-    ):
-        p -= bd.Pos(X=dot_x, Y=dot_y, Z=spec.base_thickness) * bd.Cylinder(
-            radius=spec.magnet_od / 2,
-            height=spec.magnet_height,
-            align=bde.align.ANCHOR_BOTTOM,
-        )
+    # At the other end, create a braille cell. All dots are removed in one cut.
+    dot_hole = bd.Cylinder(
+        radius=spec.magnet_od / 2,
+        height=spec.magnet_height,
+        align=bde.align.ANCHOR_BOTTOM,
+    )
+    dot_locations = bd.Locations(
+        *[
+            (dot_x, dot_y, spec.base_thickness)
+            for dot_x, dot_y in product(
+                bde.evenly_space_with_center(count=2, spacing=spec.dot_pitch),
+                bde.evenly_space_with_center(
+                    count=3, spacing=spec.dot_pitch, center=20 - 5
+                ),
+            )
+        ]
+    )
+    p -= dot_locations * dot_hole
 
     return p
 
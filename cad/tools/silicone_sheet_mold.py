@@ -89,7 +89,8 @@ def validate() -> None:
         "sheet_height_y": sheet_height_y,
     }
 
-    logger.success(f"Data: {json.dumps(data, indent=4)}")
+    # Only serialize the data if the message is actually emitted.
+    logger.opt(lazy=True).success("Data: {}", lambda: json.dumps(data, indent=4))
 
 
 def make_silicone_sheet_positive() -> bd.Part:
@@ -108,31 +109,41 @@ def make_silicone_sheet_positive() -> bd.Part:
         ),
     )
 
-    # Create a generic bump.
-    bump = (
-        bd.Part(None)
-        + bd.Sphere(dome_od / 2)
-        - bd.Sphere(radius=dome_od / 2 - dome_thickness)
-        - bd.Box(10, 10, 10, align=bde.align.ANCHOR_TOP)
+    # Create a generic bump: a hollow dome (upper half of a spherical shell), revolved
+    # from its quarter-annulus cross-section.
+    dome_id = dome_od - 2 * dome_thickness
+    bump_profile = bd.make_face(
+        [
+            bd.CenterArc((0, 0), dome_od / 2, 0, 90),
+            bd.Line((0, dome_od / 2), (0, dome_id / 2)),
+            bd.CenterArc((0, 0), dome_id / 2, 0, 90),
+            bd.Line((dome_id / 2, 0), (dome_od / 2, 0)),
+        ]
     )
+    bump = bd.revolve(bd.Plane.XZ * bump_profile, axis=bd.Axis.Z)
 
-    for dot_x, dot_y in dot_centers:
-        # Remove the dot.
-        p -= bd.Cylinder(
-            radius=dome_od / 2,
-            height=sheet_thickness * 10,
-        ).translate((dot_x, dot_y, 0))
+    dot_hole = bd.Cylinder(
+        radius=dome_od / 2,
+        height=sheet_thickness * 10,
+    )
 
-        # Create a bump there.
-        p += bump.translate((dot_x, dot_y, 0))
+    # Remove all the dots in one cut, then create a bump at each one.
+    p -= [bd.Pos(dot_x, dot_y) * dot_hole for dot_x, dot_y in dot_centers]
+    p += [bd.Pos(dot_x, dot_y) * bump for dot_x, dot_y in dot_centers]
 
     p = p.translate((-early_translation[0], -early_translation[1], 0))
 
     return p
 
 
-def make_mold_bottom() -> bd.Part:
-    """Make the top part of the mold."""
+def make_mold_bottom(sheet: bd.Part) -> bd.Part:
+    """Make the bottom part of the mold.
+
+    Args:
+    ----
+        sheet: The part from `make_silicone_sheet_positive()`.
+
+    """
     p = bd.Part(None)
 
     p += bd.Box(
@@ -143,32 +154,36 @@ def make_mold_bottom() -> bd.Part:
     )
 
     # Must fully fill the dots.
-    for dot_x, dot_y in dot_centers:
-        # Note: division-by-3 is a bit of a hack.
-        p += bd.Sphere(dome_od / 3).translate((dot_x, dot_y, 0))
+    # Note: division-by-3 is a bit of a hack.
+    dot_fill = bd.Sphere(dome_od / 3)
+    p += [bd.Pos(dot_x, dot_y) * dot_fill for dot_x, dot_y in dot_centers]
 
     # Remove the silicone sheet.
-    sheet = make_silicone_sheet_positive()
     p -= sheet.translate((0, 0, -sheet.bounding_box().min.Z - sheet_thickness))
 
     # Bolt holes.
-    for x, y in itertools.product([1, -1], [1, -1]):
-        p -= bd.Cylinder(
-            radius=mold_screw_d / 2,
-            height=20,
-        ).translate(
-            (
-                x * (mold_width_x / 2 - mold_screw_margin),
-                y * (mold_width_y / 2 - mold_screw_margin),
-                0,
-            ),
+    bolt_hole = bd.Cylinder(radius=mold_screw_d / 2, height=20)
+    p -= [
+        bd.Pos(
+            x * (mold_width_x / 2 - mold_screw_margin),
+            y * (mold_width_y / 2 - mold_screw_margin),
         )
+        * bolt_hole
+        for x, y in itertools.product([1, -1], [1, -1])
+    ]
 
     return p
 
 
-def make_mold_top() -> bd.Part:
-    """Make the top part of the mold."""
+def make_mold_top(sheet: bd.Part, mold_bottom: bd.Part) -> bd.Part:
+    """Make the top part of the mold.
+
+    Args:
+    ----
+        sheet: The part from `make_silicone_sheet_positive()`.
+        mold_bottom: The part from `make_mold_bottom(sheet)`.
+
+    """
     p = bd.Part(None)
 
     p += bd.Box(
@@ -178,28 +193,25 @@ def make_mold_top() -> bd.Part:
         align=bde.align.ANCHOR_BOTTOM,
     )
 
-    p -= make_mold_bottom()
+    p -= mold_bottom
 
     # Remove the silicone sheet.
-    sheet = make_silicone_sheet_positive()
     p -= sheet.translate((0, 0, -sheet.bounding_box().min.Z - sheet_thickness))
 
     # Bolt holes.
-    for x, y in itertools.product([1, -1], [1, -1]):
-        p -= bd.Cylinder(
-            radius=mold_screw_d / 2,
-            height=20,
-        ).translate(
-            (
-                x * (mold_width_x / 2 - mold_screw_margin),
-                y * (mold_width_y / 2 - mold_screw_margin),
-                0,
-            ),
+    bolt_hole = bd.Cylinder(radius=mold_screw_d / 2, height=20)
+    p -= [
+        bd.Pos(
+            x * (mold_width_x / 2 - mold_screw_margin),
+            y * (mold_width_y / 2 - mold_screw_margin),
         )
+        * bolt_hole
+        for x, y in itertools.product([1, -1], [1, -1])
+    ]
 
     # Remove pouring/venting holes.
-    for y in [1, -1]:
-        p -= bd.Cylinder(
+    p -= [
+        bd.Cylinder(
             radius=1.5,
             height=20,
         ).translate(
@@ -209,6 +221,8 @@ def make_mold_top() -> bd.Part:
                 0,
             ),
         )
+        for y in [1, -1]
+    ]
 
     return p
 
@@ -218,9 +232,9 @@ if __name__ == "__main__":
 
     logger.info("Showing CAD model(s)")
     parts = {
-        "silicone_sheet_positive": show(make_silicone_sheet_positive()),
-        "mold_bottom": show(make_mold_bottom()),
-        "mold_top": (make_mold_top()),
+        "silicone_sheet_positive": show(sheet := make_silicone_sheet_positive()),
+        "mold_bottom": show(mold_bottom := make_mold_bottom(sheet)),
+        "mold_top": (make_mold_top(sheet, mold_bottom)),
     }
 
     logger.info(f"Done showing {len(parts)} part(s). Saving them...")
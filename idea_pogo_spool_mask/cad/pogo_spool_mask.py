@@ -1,11 +1,14 @@
 """Create CAD models for the braille display parts."""
 
+import argparse
+import functools
 import json
 import math
 from pathlib import Path
 
 import build123d as bd
 import build123d_ease as bde
+import numpy as np
 from bd_warehouse.gear import SpurGear
 from build123d_ease import show
 from loguru import logger
@@ -62,6 +65,9 @@ spool_bearing_thickness = 2.5
 
 # Gear specs.
 gear_module = 0.2
+gear_pressure_angle = 14.5  # Controls tooth length.
+gear_involute_sample_count = 5  # Points per tooth flank. Teeth are <0.5mm tall.
+use_polyline_involute_gears = True  # False falls back to bd_warehouse SpurGear.
 spool_gear_tooth_count = 64
 spool_gear_thickness = 1.1
 spool_flange_thickness = 0.5
@@ -126,6 +132,9 @@ spool_vs_motor_delta_z = (
 
 bar_holder_horizontal_bolt_center_z = motor_shaft_z + spool_vs_motor_delta_z
 
+# Spool is centered on the pulley. Gear face is the outermost face on +X.
+spool_gear_face_x = spool_pulley_width / 2 + spool_gear_thickness
+
 
 def validate_dimensions_and_info() -> None:
     """Validate that the dimensions are within the expected range.
@@ -162,127 +171,218 @@ def validate_dimensions_and_info() -> None:
     logger.info("Dimensions validated.")
 
 
+def make_involute_gear_outline(tooth_count: int) -> np.ndarray:
+    """Compute the closed polyline outline of an involute spur gear.
+
+    Uses the same addendum (1 module) and dedendum (1.25 module) as
+    `bd_warehouse.gear.SpurGear`. The first tooth is centered on the +X axis.
+
+    Returns an (N, 2) array of XY points, counter-clockwise.
+    """
+    pitch_radius = gear_module * tooth_count / 2
+    pressure_angle = math.radians(gear_pressure_angle)
+    base_radius = pitch_radius * math.cos(pressure_angle)
+    addendum_radius = pitch_radius + gear_module
+    root_radius = pitch_radius - 1.25 * gear_module
+
+    # Half of the tooth's angular thickness, measured at the base circle.
+    half_base_angle = math.pi / (2 * tooth_count) + (
+        math.tan(pressure_angle) - pressure_angle
+    )
+
+    # Involute flank, from the base circle (or root, if larger) out to the tip.
+    t_min = math.sqrt(max((root_radius / base_radius) ** 2 - 1, 0))
+    t_max = math.sqrt((addendum_radius / base_radius) ** 2 - 1)
+    t = np.linspace(t_min, t_max, gear_involute_sample_count)
+    flank_r = base_radius * np.sqrt(1 + t**2)
+    flank_angle = half_base_angle - (t - np.arctan(t))
+
+    # One tooth: lower flank going out, then upper flank coming back in.
+    tooth_r = np.concatenate([flank_r, flank_r[::-1]])
+    tooth_angle = np.concatenate([-flank_angle, flank_angle[::-1]])
+    if root_radius < base_radius:
+        # Radial line from the root circle up to the start of the involute.
+        tooth_r = np.concatenate([[root_radius], tooth_r, [root_radius]])
+        tooth_angle = np.concatenate(
+            [[-half_base_angle], tooth_angle, [half_base_angle]],
+        )
+
+    # Repeat the tooth around the gear (broadcast: teeth x points).
+    tooth_centers = np.arange(tooth_count) * (2 * math.pi / tooth_count)
+    all_angle = (tooth_centers[:, np.newaxis] + tooth_angle).ravel()
+    all_r = np.tile(tooth_r, tooth_count)
+
+    return np.column_stack([all_r * np.cos(all_angle), all_r * np.sin(all_angle)])
+
+
+def make_spur_gear(
+    *,
+    tooth_count: int,
+    thickness: float,
+    bore_d: float | None = None,
+) -> bd.Part:
+    """Make a spur gear, centered in XY, extending up from Z=0.
+
+    Builds the involute directly as a polyline, which is much faster than the
+    spline fitting in `SpurGear`. Set `use_polyline_involute_gears = False` to
+    fall back to `SpurGear`.
+
+    Args:
+        tooth_count: Number of teeth.
+        thickness: Gear thickness (Z).
+        bore_d: Optional center hole diameter. Cut in 2D when possible.
+
+    """
+    if not use_polyline_involute_gears:
+        gear = SpurGear(
+            module=gear_module,
+            tooth_count=tooth_count,
+            thickness=thickness,
+            pressure_angle=gear_pressure_angle,
+            root_fillet=0.001,  # Rounding at base of each tooth.
+            align=bde.align.ANCHOR_BOTTOM,
+        )
+        if bore_d is not None:
+            gear -= bd.Cylinder(
+                radius=bore_d / 2,
+                height=thickness,
+                align=bde.align.ANCHOR_BOTTOM,
+            )
+        return gear
+
+    outline = make_involute_gear_outline(tooth_count)
+    gear_face = bd.Polygon([tuple(pt) for pt in outline], align=None)
+    if bore_d is not None:
+        gear_face -= bd.Circle(radius=bore_d / 2)
+
+    return bd.extrude(gear_face, amount=thickness)
+
+
 def make_motor_model() -> bd.Part:
     """Make a motor model for rendering, mostly.
 
     Origin plane is at PCB.
     Origin (XY): Tip of the motor shaft/gear.
     """
-    part = bd.Part(None)
+    # Collect every primitive, then fuse them all at once.
+    primitives: list[bd.Part] = []
 
     # Add tiny ball at origin for tracking.
-    part += bd.Sphere(radius=0.25) & bd.Box(
-        10,
-        10,
-        10,
-        align=bde.align.ANCHOR_BOTTOM,
+    primitives.append(
+        bd.Sphere(radius=0.25)
+        & bd.Box(
+            10,
+            10,
+            10,
+            align=bde.align.ANCHOR_BOTTOM,
+        ),
     )
 
     motor_body_center_x = -motor_shaft_length - motor_body_width_x / 2
 
     # Add the motor body (box part, esp at bottom).
-    part += bd.Box(
-        motor_body_width_x - 2,
-        motor_pin_sep_y * 1.2,
-        1,
-        align=(bd.Align.MAX, bd.Align.CENTER, bd.Align.MIN),
-    ).translate((-motor_shaft_length - 1, 0, 0))
+    primitives.append(
+        bd.Box(
+            motor_body_width_x - 2,
+            motor_pin_sep_y * 1.2,
+            1,
+            align=(bd.Align.MAX, bd.Align.CENTER, bd.Align.MIN),
+        ).translate((-motor_shaft_length - 1, 0, 0)),
+    )
 
     # Add the motor body (round part, esp at top).
-    part += bd.Cylinder(
-        radius=motor_body_width_y / 2,
-        height=motor_body_width_x,
-        align=bde.align.ANCHOR_BOTTOM,  # Align pre-rotation.
-        rotation=bde.rotation.NEG_X,
-    ).translate(
-        (
-            -motor_shaft_length,
-            0,
-            motor_body_width_y / 2,
+    primitives.append(
+        bd.Cylinder(
+            radius=motor_body_width_y / 2,
+            height=motor_body_width_x,
+            align=bde.align.ANCHOR_BOTTOM,  # Align pre-rotation.
+            rotation=bde.rotation.NEG_X,
+        ).translate(
+            (
+                -motor_shaft_length,
+                0,
+                motor_body_width_y / 2,
+            ),
         ),
     )
 
     # Add the motor PCB pins.
-    for x_sign, y_sign in [(1, 1), (-1, 1), (1, -1), (-1, -1)]:
-        part += bd.Cylinder(
+    primitives.extend(
+        bd.Pos(X=motor_body_center_x)
+        * bd.GridLocations(
+            x_spacing=motor_pin_sep_x,
+            y_spacing=motor_pin_sep_y,
+            x_count=2,
+            y_count=2,
+        )
+        * bd.Cylinder(
             radius=motor_pin_diameter / 2,
             height=motor_pin_length,
             align=(bd.Align.CENTER, bd.Align.CENTER, bd.Align.MAX),
-        ).translate(
-            (
-                motor_body_center_x + (x_sign * motor_pin_sep_x / 2),
-                y_sign * motor_pin_sep_y / 2,
-                0,
-            ),
-        )
+        ),
+    )
 
     # Add the motor shaft.
-    part += (
+    primitives.append(
         bd.Cylinder(
             radius=motor_shaft_diameter / 2,
             height=motor_shaft_length,
             align=(bd.Align.CENTER, bd.Align.CENTER, bd.Align.MAX),
         )
         .rotate(bd.Axis.Y, angle=90)
-        .translate((0, 0, motor_shaft_z))
+        .translate((0, 0, motor_shaft_z)),
     )
 
     # Add the gear.
-    part += (
-        SpurGear(
-            module=gear_module,
+    primitives.append(
+        make_spur_gear(
             tooth_count=motor_gear_tooth_count,
             thickness=motor_gear_length,
-            pressure_angle=14.5,  # Controls tooth length.
-            root_fillet=0.001,  # Rounding at base of each tooth.
-            align=bde.align.ANCHOR_BOTTOM,
         )
         .rotate(angle=-90, axis=bd.Axis.Y)
-        .translate((0, 0, motor_shaft_z))
+        .translate((0, 0, motor_shaft_z)),
     )
 
+    part = bd.Part(None) + primitives
+
     logger.info(f"Motor model bounding box: {part.bounding_box()}")
 
     return part
 
 
+@functools.lru_cache(maxsize=8)
 def make_pogo_pin(pogo_throw_tip_od_delta: float = 0) -> bd.Part:
     """Make a pogo pin to act as a negative for the print-in-place surrounding part.
 
     * Orientation: Pin extends up.
     * Origin (XY): Center of bottom of flange. `pogo_length` extends up.
+    * Cached: the same Part is returned for the same args. Don't modify it in place.
     """
-    with bd.BuildPart() as pogo_pin_part:
-        # Below flange.
-        bd.Cylinder(
-            radius=pogo_below_flange_od / 2,
-            height=pogo_below_flange_length,
-            align=(bd.Align.CENTER, bd.Align.CENTER, bd.Align.MAX),
-        )
-
-        # Flange.
-        bd.Cylinder(
-            radius=pogo_flange_od / 2,
-            height=pogo_flange_length,
-            align=bde.align.ANCHOR_BOTTOM,
-        )
-
-        # Shaft.
-        bd.Cylinder(
-            radius=pogo_shaft_od / 2,
-            height=pogo_shaft_length,
-            align=bde.align.ANCHOR_BOTTOM,
-        )
-
-        # Throw/tip.
-        with bd.Locations(pogo_pin_part.faces().sort_by(bd.Axis.Z)[-1]):
-            bd.Cylinder(
-                radius=(pogo_throw_tip_od + pogo_throw_tip_od_delta) / 2,
-                height=pogo_throw_length,
-                align=bde.align.ANCHOR_BOTTOM,
-            )
+    throw_tip_r = (pogo_throw_tip_od + pogo_throw_tip_od_delta) / 2
+    top_z = pogo_shaft_length + pogo_throw_length
+
+    # Stepped (radius, Z) half cross-section, revolved around the Z axis.
+    profile = bd.Polygon(
+        [
+            # Below flange.
+            (0, -pogo_below_flange_length),
+            (pogo_below_flange_od / 2, -pogo_below_flange_length),
+            (pogo_below_flange_od / 2, 0),
+            # Flange.
+            (pogo_flange_od / 2, 0),
+            (pogo_flange_od / 2, pogo_flange_length),
+            # Shaft (starts at the bottom of the flange, like the flange).
+            (pogo_shaft_od / 2, pogo_flange_length),
+            (pogo_shaft_od / 2, pogo_shaft_length),
+            # Throw/tip, on top of the shaft.
+            (throw_tip_r, pogo_shaft_length),
+            (throw_tip_r, top_z),
+            (0, top_z),
+        ],
+        align=None,
+    )
 
-    return pogo_pin_part.part
+    return bd.revolve(bd.Plane.XZ * profile, axis=bd.Axis.Z)
 
 
 def make_housing() -> bd.Part:
@@ -300,19 +400,15 @@ def make_housing() -> bd.Part:
         height=housing_size_z,
         align=bde.align.ANCHOR_BOTTOM,
     )
-    box_top_face = part.faces().sort_by(bd.Axis.Z)[-1]
+    box_top_z = housing_size_z  # Box is anchored at the bottom.
 
     # Remove the pogo pin holes. Set the Z by making the pogo pin stick out
     # the perfect amount to get `dot_height` above the top face.
-    part -= dot_center_grid_locations * make_pogo_pin(
-        pogo_throw_tip_od_delta=0.5,
-    ).translate(
-        (
-            0,
-            0,
-            box_top_face.center().Z - pogo_length + dot_height,
-        ),
-    )
+    pogo_pin_offset = bd.Pos(Z=box_top_z - pogo_length + dot_height)
+    part -= [
+        grid_pos * pogo_pin_offset * make_pogo_pin(pogo_throw_tip_od_delta=0.5)
+        for grid_pos in dot_center_grid_locations
+    ]
 
     # Remove the tape.
     part -= bd.Box(
@@ -320,7 +416,7 @@ def make_housing() -> bd.Part:
         100,
         0.5,  # Thickness of tape passage.
         align=bde.align.ANCHOR_CENTER,
-    ).translate((0, 0, box_top_face.center().Z - 1))
+    ).translate((0, 0, box_top_z - 1))
 
     return part
 
@@ -346,8 +442,8 @@ def make_housing_chain(cell_count: int) -> bd.Part:
         )
 
     # Add on edge plates.
-    chain_min_x = part.faces().sort_by(bd.Axis.X)[0].center().X
-    chain_max_x = part.faces().sort_by(bd.Axis.X)[-1].center().X
+    chain_min_x = -housing_size_x / 2
+    chain_max_x = (cell_count - 1) * inter_cell_dot_pitch_x + housing_size_x / 2
 
     for x, mount_align in ((chain_min_x, bd.Align.MAX), (chain_max_x, bd.Align.MIN)):
         part += bd.Box(
@@ -392,13 +488,18 @@ def make_horizontal_bar_holder() -> bd.Part:
             ),
         )
 
-    # Add the anchor peg additions
+    # Add the anchor peg additions. Fillet one peg, then place copies of it.
+    peg_cyl = bd.Part(None) + bd.Cylinder(
+        radius=bar_holder_peg_d / 2,
+        height=bar_holder_peg_len,
+        align=(bd.Align.CENTER, bd.Align.CENTER, bd.Align.MAX),
+    )
+    peg = peg_cyl.fillet(
+        radius=bar_holder_peg_d * 0.4,
+        edge_list=list(peg_cyl.faces().sort_by(bd.Axis.Z)[0].edges()),
+    )
     for x_sign, y_sign in [(1, -1), (-1, 1)]:
-        peg_cyl = bd.Part(None) + bd.Cylinder(
-            radius=bar_holder_peg_d / 2,
-            height=bar_holder_peg_len,
-            align=(bd.Align.CENTER, bd.Align.CENTER, bd.Align.MAX),
-        ).translate(
+        part += peg.translate(
             (
                 x_sign * bar_holder_anchor_bolt_sep_x / 2,
                 y_sign * bar_holder_anchor_bolt_sep_y / 2,
@@ -406,11 +507,6 @@ def make_horizontal_bar_holder() -> bd.Part:
             ),
         )
 
-        part += peg_cyl.fillet(
-            radius=bar_holder_peg_d * 0.4,
-            edge_list=list(peg_cyl.faces().sort_by(bd.Axis.Z)[0].edges()),
-        )
-
     return part
 
 
@@ -420,59 +516,41 @@ def make_gear_spool() -> bd.Part:
         spool_gear_thickness + spool_flange_thickness + spool_pulley_width
     )
 
-    part = bd.Part(None)
-
-    # Spool pulley (in x axis).
-    part += bd.Cylinder(
-        radius=spool_pulley_od / 2,
-        height=spool_pulley_width,
-        align=(bd.Align.CENTER, bd.Align.CENTER, bd.Align.CENTER),
-        rotation=(0, 90, 0),
+    pulley_min_x = -spool_pulley_width / 2
+    pulley_max_x = spool_pulley_width / 2
+    flange_min_x = pulley_min_x - spool_flange_thickness
+
+    # Half cross-section of the pulley, flange, bearing pockets, and bolt hole,
+    # as (X, radius) points. The gear-side bearing pocket continues into the gear.
+    spool_profile = bd.Polygon(
+        [
+            (flange_min_x, spool_bearing_od / 2),
+            (flange_min_x, spool_flange_od / 2),
+            (pulley_min_x, spool_flange_od / 2),
+            (pulley_min_x, spool_pulley_od / 2),
+            (pulley_max_x, spool_pulley_od / 2),
+            (pulley_max_x, spool_bearing_od / 2),
+            (spool_gear_face_x - spool_bearing_thickness, spool_bearing_od / 2),
+            (spool_gear_face_x - spool_bearing_thickness, spool_bolt_d / 2),
+            (flange_min_x + spool_bearing_thickness, spool_bolt_d / 2),
+            (flange_min_x + spool_bearing_thickness, spool_bearing_od / 2),
+        ],
+        align=None,
     )
 
-    # Add gear (on POS_X side).
-    part += SpurGear(
-        module=gear_module,
-        tooth_count=spool_gear_tooth_count,
-        thickness=spool_gear_thickness,
-        # TODO(KilowattSynthesis): Pressure angle might not be right. Was sorta random.
-        pressure_angle=14.5,  # Controls tooth length.
-        root_fillet=0.001,  # Rounding at base of each tooth.
-        rotation=bd.Rotation(*bde.rotation.POS_X),
-        align=bde.align.ANCHOR_BOTTOM,  # Normal mode.
-    ).translate((part.bounding_box().max.X, 0, 0))
-
-    # Add flange (on NEG_X side).
-    part += bd.Cylinder(
-        radius=spool_flange_od / 2,
-        height=spool_flange_thickness,
-        rotation=bde.rotation.NEG_X,
-        align=bde.align.ANCHOR_BOTTOM,  # Normal mode.
-    ).translate((part.bounding_box().min.X, 0, 0))
-
-    # Remove bearing (gear side, POS_X).
-    part -= bd.Cylinder(
-        radius=spool_bearing_od / 2,
-        height=spool_bearing_thickness,
-        rotation=bde.rotation.NEG_X,
-        align=bde.align.ANCHOR_BOTTOM,
-    ).translate((part.bounding_box().max.X, 0, 0))
-
-    # Remove bearing (non-gear side, NEG_X).
-    part -= bd.Cylinder(
-        radius=spool_bearing_od / 2,
-        height=spool_bearing_thickness,
-        rotation=bde.rotation.POS_X,
-        align=bde.align.ANCHOR_BOTTOM,
-    ).translate((part.bounding_box().min.X, 0, 0))
+    # Spool pulley/flange body (in x axis).
+    part = bd.revolve(spool_profile, axis=bd.Axis.X)
 
-    # Remove center bolt hole.
-    part -= bd.Cylinder(
-        radius=spool_bolt_d / 2,
-        height=100,
-        align=(bd.Align.CENTER, bd.Align.CENTER, bd.Align.CENTER),
-        rotation=(0, 90, 0),
-    )
+    # Add gear (on POS_X side), with the bearing pocket already removed.
+    # TODO(KilowattSynthesis): Pressure angle might not be right. Was sorta random.
+    part += (
+        bd.Rotation(*bde.rotation.POS_X)
+        * make_spur_gear(
+            tooth_count=spool_gear_tooth_count,
+            thickness=spool_gear_thickness,
+            bore_d=spool_bearing_od,
+        )
+    ).translate((pulley_max_x, 0, 0))
 
     # Log the envelope.
     logger.info(f"Spool envelope: {part.bounding_box()}")
@@ -488,19 +566,18 @@ def make_spool_motor_assembly() -> bd.Part:
 
     p += make_motor_model()
 
-    spool = make_gear_spool()
-    spool = spool.translate(
+    spool = make_gear_spool().translate(
         (
-            -spool.faces().sort_by(bd.Axis.X)[-1].center().X,
+            -spool_gear_face_x,
             spool_vs_motor_delta_y,
             motor_shaft_z + spool_vs_motor_delta_z,
         ),
     )
     p += spool
 
-    if spool.bounding_box().min.Z < 0:
+    if (spool_min_z := spool.bounding_box().min.Z) < 0:
         logger.warning(
-            f"Bounding box min Z is below 0: {spool.bounding_box().min.Z:,.3f}. "
+            f"Bounding box min Z is below 0: {spool_min_z:,.3f}. "
             "Gear is probably dipping into the PCB. "
             "Adjust `spool_mounting_angle`, probably.",
         )
@@ -509,6 +586,15 @@ def make_spool_motor_assembly() -> bd.Part:
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--no-stl", action="store_true", help="Skip STL export.")
+    parser.add_argument(
+        "--no-step",
+        action="store_true",
+        help="Skip STEP export (much slower than STL).",
+    )
+    args = parser.parse_args()
+
     validate_dimensions_and_info()
 
     parts = {
@@ -530,7 +616,9 @@ if __name__ == "__main__":
         / Path(__file__).stem
     ).mkdir(exist_ok=True, parents=True)
     for name, part in parts.items():
-        bd.export_stl(part, str(export_folder / f"{name}.stl"))
-        bd.export_step(part, str(export_folder / f"{name}.step"))
+        if not args.no_stl:
+            bd.export_stl(part, str(export_folder / f"{name}.stl"))
+        if not args.no_step:
+            bd.export_step(part, str(export_folder / f"{name}.step"))
 
     logger.info("Done")
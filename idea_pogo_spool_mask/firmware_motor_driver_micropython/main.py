@@ -1,20 +1,24 @@
+import gc
 import time
 
+import micropython
 from machine import I2C, Pin
+from micropython import const
 from neopixel import NeoPixel
 
-PIN_ONBOARD_LED = 16
+PIN_ONBOARD_LED = const(16)
 onboard_led_pin = Pin(PIN_ONBOARD_LED, Pin.OUT)
+onboard_led = NeoPixel(onboard_led_pin, 1)
 
 
-PIN_I2C_SDA = 26
-PIN_I2C_SCL = 27
-PIN_N_SLEEP_CELL_0 = 9
-PIN_N_SLEEP_CELL_1 = 10
-PIN_N_SLEEP_CELL_2 = 11  # U3/M3
-PIN_N_SLEEP_CELL_3 = 12
+PIN_I2C_SDA = const(26)
+PIN_I2C_SCL = const(27)
+PIN_N_SLEEP_CELL_0 = const(9)
+PIN_N_SLEEP_CELL_1 = const(10)
+PIN_N_SLEEP_CELL_2 = const(11)  # U3/M3
+PIN_N_SLEEP_CELL_3 = const(12)
 
-PIN_N_FAULT_CELL_2 = 2  # U3/M3
+PIN_N_FAULT_CELL_2 = const(2)  # U3/M3
 
 
 # References:
@@ -27,32 +31,43 @@ PIN_N_FAULT_CELL_2 = 2  # U3/M3
 # - Reprogram the addresses one-by-one using nFAULT.
 
 # 0x60 = 96
-DRV8847S_DEFAULT_I2C_ADDR = 0x60  # 7-bit address
+DRV8847S_DEFAULT_I2C_ADDR = const(0x60)  # 7-bit address
 
 i2c = I2C(1, scl=Pin(PIN_I2C_SCL), sda=Pin(PIN_I2C_SDA), freq=400000)
+
+# Print every register write. Slow (blocks on USB/UART), so only for debugging.
+# As a const, the compiler drops the disabled print branch entirely.
+DEBUG_REGISTER_WRITES = const(0)  # Set to 1 to enable.
 # pin_nfault_2 = Pin(PIN_N_FAULT_CELL_2, Pin.IN, Pin.PULL_UP)
 
+# Register I/O buffers, reused on every access so register I/O doesn't allocate.
+register_write_buf = bytearray(1)
+register_read_buf = bytearray(1)
+
 
-REGISTER_ADDRESS_IC1_CONTROL = 0x01  # Control register address
-REGISTER_ADDRESS_IC2_CONTROL = 0x02  # Control register address
-REGISTER_ADDRESS_FAULT_STATUS_2 = 0x04  # Fault status register address
+REGISTER_ADDRESS_IC1_CONTROL = const(0x01)  # Control register address
+REGISTER_ADDRESS_IC2_CONTROL = const(0x02)  # Control register address
+REGISTER_ADDRESS_FAULT_STATUS_2 = const(0x04)  # Fault status register address
 
 # HALF_STEP_SEQUENCE = [0x44, 0x4C, 0x0C, 0x2C, 0x24, 0x34, 0x14, 0x54]
-HALF_STEP_SEQUENCE = [
-    # 0b IN4 IN3 IN2 IN1
-    0b1000,  # Sequence step 1
-    0b1001,  # Sequence step 2
-    0b0001,  # Sequence step 3
-    0b0101,  # Sequence step 4
-    0b0100,  # Sequence step 5
-    0b0110,  # Sequence step 6
-    0b0010,  # Sequence step 7
-    0b1010,  # Sequence step 8
-]
-
-IC1_I2CBC_SELECT = 0b1  # Control via register instead of input pins.
-IC1_MODE_4_INPUTS = 0b0  # 0b0=4-input interface.
-IC1_TRQ_SETTING = 0b1  # 0b1=50% torque mode.
+# Stored as bytes: one flat byte per step instead of a list of int objects.
+HALF_STEP_SEQUENCE = bytes(
+    (
+        # 0b IN4 IN3 IN2 IN1
+        0b1000,  # Sequence step 1
+        0b1001,  # Sequence step 2
+        0b0001,  # Sequence step 3
+        0b0101,  # Sequence step 4
+        0b0100,  # Sequence step 5
+        0b0110,  # Sequence step 6
+        0b0010,  # Sequence step 7
+        0b1010,  # Sequence step 8
+    )
+)
+
+IC1_I2CBC_SELECT = const(0b1)  # Control via register instead of input pins.
+IC1_MODE_4_INPUTS = const(0b0)  # 0b0=4-input interface.
+IC1_TRQ_SETTING = const(0b1)  # 0b1=50% torque mode.
 
 # Registers
 # Table 7-15. I2C Registers
@@ -77,59 +92,109 @@ IC1_TRQ_SETTING = 0b1  # 0b1=50% torque mode.
 
 def write_register(address: int, register: int, value: int) -> None:
     """Write a single byte to a register on the DRV8847S."""
-    print(f"write_register({address=}, {register=}, {value=}) ...")
+    if DEBUG_REGISTER_WRITES:
+        print(f"write_register({address=}, {register=}, {value=}) ...")
 
-    data = bytearray([register, value])
-    i2c.writeto(address, data)
+    # Same bus transaction as writing [register, value], without building it here.
+    register_write_buf[0] = value
+    i2c.writeto_mem(address, register, register_write_buf)
 
 
 def read_from_register(address: int, register: int) -> int:
     """Read a single byte from a register on the DRV8847S."""
-    i2c.writeto(address, bytearray([register]))
-    data = i2c.readfrom(address, 1)
-    val = data[0]
+    # One write-then-read transaction (repeated start), not a separate write + read.
+    i2c.readfrom_mem_into(address, register, register_read_buf)
+    val = register_read_buf[0]
     print(
         f"read_from_register({address=}, {register=}) = {val} = 0x{val:x} = 0b{val:b} ..."
     )
     return val
 
 
+def encode_ic1_control(*, trq: int, step_value: int, i2cbc: int, mode: int) -> int:
+    """Encode the IC1_CON register value for a drive command."""
+    return (trq << 7) | (step_value << 3) | (i2cbc << 2) | (mode << 1)
+
+
+def encode_step_bufs(step_seq: bytes) -> tuple[bytes, ...]:
+    """Encode the IC1_CON value for each step, ready to write to the register."""
+    return tuple(
+        bytes(
+            [
+                encode_ic1_control(
+                    trq=IC1_TRQ_SETTING,  # Enable TRQ = 50% torque mode (heat).
+                    step_value=step_value,
+                    i2cbc=IC1_I2CBC_SELECT,
+                    mode=IC1_MODE_4_INPUTS,
+                ),
+            ]
+        )
+        for step_value in step_seq
+    )
+
+
+# Encoded once at import, so drive_motor doesn't encode or slice on each call.
+HALF_STEP_BUFS = encode_step_bufs(HALF_STEP_SEQUENCE)
+HALF_STEP_BUFS_REVERSE = HALF_STEP_BUFS[::-1]
+
+
 def send_drive_command(
     i2c_addr: int, *, trq: int, step_value: int, i2cbc: int, mode: int
 ) -> None:
     """Send a drive command to the DRV8847S."""
-    ic1_val = (trq << 7) | (step_value << 3) | (i2cbc << 2) | (mode << 1)
+    ic1_val = encode_ic1_control(trq=trq, step_value=step_value, i2cbc=i2cbc, mode=mode)
     write_register(i2c_addr, REGISTER_ADDRESS_IC1_CONTROL, ic1_val)
 
 
+# Native code skips the bytecode dispatcher for the step loop, for steadier timing.
+@micropython.native
 def drive_motor(
     step_period_sec: float,
     step_count: int,
-    step_seq: list[int] = HALF_STEP_SEQUENCE,
+    step_seq: bytes = HALF_STEP_SEQUENCE,
     i2c_addr: int = DRV8847S_DEFAULT_I2C_ADDR,
 ) -> None:
     """Drive the motor."""
     # TODO: Support reverse direction.
-    done_step_count = 0
-
-    step_seq_run = step_seq[::-1] if step_count < 0 else step_seq
     abs_step_count = abs(step_count)
 
-    while 1:
-        for step_value in step_seq_run:
-            # Enable TRQ = 50% torque mode (heat).
-            send_drive_command(
-                i2c_addr=i2c_addr,
-                trq=IC1_TRQ_SETTING,
-                step_value=step_value,
-                i2cbc=IC1_I2CBC_SELECT,
-                mode=IC1_MODE_4_INPUTS,
-            )
-            time.sleep(step_period_sec)
-            done_step_count += 1
-
-            if done_step_count >= abs_step_count:
-                return
+    if step_seq is HALF_STEP_SEQUENCE:
+        step_bufs = HALF_STEP_BUFS_REVERSE if step_count < 0 else HALF_STEP_BUFS
+    else:
+        step_bufs = encode_step_bufs(step_seq[::-1] if step_count < 0 else step_seq)
+
+    # Step on fixed deadlines, so the I2C write time doesn't stretch the period.
+    step_period_us = int(step_period_sec * 1_000_000)
+
+    # Bind the per-step calls to locals, which are cheaper to look up than
+    # module globals and their attributes.
+    writeto_mem = i2c.writeto_mem
+    ticks_us, ticks_add, ticks_diff = time.ticks_us, time.ticks_add, time.ticks_diff
+    sleep_us = time.sleep_us
+
+    # Run whole passes through the sequence, then the leftover steps, so there's no
+    # step counting inside the loop.
+    full_cycle_count, remainder_step_count = divmod(abs_step_count, len(step_bufs))
+    remainder_step_bufs = step_bufs[:remainder_step_count]
+
+    # Collect up front, and keep automatic GC from pausing mid-move. The loop below
+    # doesn't allocate.
+    gc.collect()
+    gc.disable()
+    try:
+        next_step_time_us = ticks_us()
+        for cycle_num in range(full_cycle_count + 1):
+            if cycle_num < full_cycle_count:
+                cycle_step_bufs = step_bufs
+            else:
+                cycle_step_bufs = remainder_step_bufs
+
+            for step_buf in cycle_step_bufs:
+                writeto_mem(i2c_addr, REGISTER_ADDRESS_IC1_CONTROL, step_buf)
+                next_step_time_us = ticks_add(next_step_time_us, step_period_us)
+                sleep_us(max(0, ticks_diff(next_step_time_us, ticks_us())))
+    finally:
+        gc.enable()
 
 
 def disable_motor(i2c_addr: int = DRV8847S_DEFAULT_I2C_ADDR) -> None:
@@ -165,9 +230,8 @@ def set_led_color(r: int, g: int, b: int) -> None:
 
     Values should be between 0 and 255.
     """
-    np = NeoPixel(onboard_led_pin, 1)
-    np[0] = (r, g, b)
-    np.write()
+    onboard_led[0] = (r, g, b)
+    onboard_led.write()
 
 
 def loop() -> None: